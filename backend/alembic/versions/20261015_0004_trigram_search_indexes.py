@@ -0,0 +1,48 @@
+"""add trigram GIN indexes for keyword search columns
+
+Revision ID: 20261015_0004
+Revises: 20260306_0003
+Create Date: 2026-10-15
+
+RAGService._keyword_search ORs ILIKE '%kw%' over text_integral, contestator,
+autoritate_contractanta, filename, cpv_descriere and cpv_clasa. Only
+text_integral had a pg_trgm index, so the OR always fell back to a
+sequential scan. With a gin_trgm_ops index on every column Postgres can
+serve each ILIKE branch from an index and combine them with a BitmapOr.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261015_0004'
+down_revision = '20260306_0003'
+branch_labels = None
+depends_on = None
+
+
+TRIGRAM_INDEXES = {
+    'ix_decizii_contestator_trgm': 'contestator',
+    'ix_decizii_autoritate_trgm': 'autoritate_contractanta',
+    'ix_decizii_filename_trgm': 'filename',
+    'ix_decizii_cpv_descriere_trgm': 'cpv_descriere',
+    'ix_decizii_cpv_clasa_trgm': 'cpv_clasa',
+}
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # CONCURRENTLY avoids locking decizii_cnsc for writes during the build;
+    # it cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        for index_name, column in TRIGRAM_INDEXES.items():
+            op.execute(f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name}
+                ON decizii_cnsc
+                USING gin ({column} gin_trgm_ops)
+            """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name in TRIGRAM_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
@@ -0,0 +1,45 @@
+"""add rag_response_cache table for the semantic answer cache
+
+Revision ID: 20261015_0005
+Revises: 20261015_0004
+Create Date: 2026-10-15
+
+Stores generated RAG answers keyed on the question embedding so that
+near-duplicate questions can be answered without retrieval or an LLM call.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from pgvector.sqlalchemy import Vector
+
+# revision identifiers, used by Alembic.
+revision = '20261015_0005'
+down_revision = '20261015_0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'rag_response_cache',
+        sa.Column('id', postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column('params_hash', sa.String(length=64), nullable=False),
+        sa.Column('query_text', sa.Text(), nullable=False),
+        sa.Column('embedding', Vector(2000), nullable=False),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_rag_cache_params', 'rag_response_cache', ['params_hash', 'created_at'], unique=False)
+    op.execute("""
+        CREATE INDEX ix_rag_cache_embedding_hnsw
+        ON rag_response_cache
+        USING hnsw (embedding vector_cosine_ops)
+        WITH (m = 16, ef_construction = 64)
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_rag_cache_embedding_hnsw', table_name='rag_response_cache', if_exists=True)
+    op.drop_index('ix_rag_cache_params', table_name='rag_response_cache')
+    op.drop_table('rag_response_cache')
@@ -0,0 +1,44 @@
+"""add generated tsvector column for ranked full-text search on decisions
+
+Revision ID: 20261015_0006
+Revises: 20261015_0005
+Create Date: 2026-10-15
+
+RAGService._keyword_search first runs a ranked full-text query against
+search_vec (text_integral + contestator + autoritate_contractanta). When it
+returns fewer than the requested number of decisions, the trigram ILIKE scan
+tops up the rest.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261015_0006'
+down_revision = '20261015_0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Adding a STORED generated column rewrites decizii_cnsc once.
+    op.execute("""
+        ALTER TABLE decizii_cnsc
+        ADD COLUMN IF NOT EXISTS search_vec tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('simple', coalesce(text_integral, '') || ' ' ||
+                                  coalesce(contestator, '') || ' ' ||
+                                  coalesce(autoritate_contractanta, ''))
+        ) STORED
+    """)
+
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_decizii_search_vec
+            ON decizii_cnsc
+            USING gin (search_vec)
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_decizii_search_vec")
+    op.execute("ALTER TABLE decizii_cnsc DROP COLUMN IF EXISTS search_vec")
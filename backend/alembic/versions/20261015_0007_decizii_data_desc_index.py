@@ -0,0 +1,31 @@
+"""add data_decizie DESC NULLS LAST index for newest-first listings
+
+Revision ID: 20261015_0007
+Revises: 20261015_0006
+Create Date: 2026-10-15
+
+The keyword, legal-reference and CPV searches in RAGService all end with
+ORDER BY data_decizie DESC NULLS LAST LIMIT n. A backward scan of the
+ascending ix_decizii_data yields NULLS FIRST, so Postgres sorted the whole
+match set instead; this index turns it into a top-k index scan.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261015_0007'
+down_revision = '20261015_0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_decizii_data_desc
+            ON decizii_cnsc (data_decizie DESC NULLS LAST)
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_decizii_data_desc")
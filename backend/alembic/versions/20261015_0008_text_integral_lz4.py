@@ -0,0 +1,32 @@
+"""store decizii_cnsc.text_integral with lz4 TOAST compression
+
+Revision ID: 20261015_0008
+Revises: 20261015_0007
+Create Date: 2026-10-15
+
+text_integral holds the full decision (~39KB, up to a few hundred KB) and
+is always TOASTed. Switching the column from the default pglz to lz4
+(Postgres 14+) compresses and decompresses several times faster at a
+similar ratio, which cuts import CPU/WAL time and speeds up the few reads
+that load the full text. The column stays TEXT, so the trigram index, the
+generated search_vec column and ILIKE searches are unaffected.
+
+Only newly written values use lz4; existing rows keep pglz until they are
+rewritten (e.g. VACUUM FULL or a re-import), which Postgres handles
+transparently.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261015_0008'
+down_revision = '20261015_0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE decizii_cnsc ALTER COLUMN text_integral SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE decizii_cnsc ALTER COLUMN text_integral SET COMPRESSION pglz")
@@ -42,6 +42,14 @@ class Settings(BaseSettings):
     embedding_provider: Literal["vertex", "openai", "local"] = "vertex"
     embedding_model: str = "text-embedding-004"
 
+    # RAG semantic response cache
+    rag_semantic_cache_enabled: bool = True
+    rag_semantic_cache_threshold: float = 0.92  # min cosine similarity for a hit
+    rag_semantic_cache_ttl_hours: int = 24
+
+    # RAG prompt context budget (~4 chars/token estimate)
+    rag_context_budget_tokens: int = 16000
+
     # JWT Authentication
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
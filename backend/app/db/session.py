@@ -47,8 +47,11 @@ async def init_db() -> bool:
         db_url = settings.async_database_url
 
         # Create engine with appropriate settings
+        # - query_cache_size: compiled-SQL cache; the RAG searches produce one
+        #   entry per keyword count / IN-list length, which overflows the default 500
         engine_kwargs = {
             "echo": settings.debug,
+            "query_cache_size": 1200,
         }
 
         # PostgreSQL-specific settings tuned for Cloud Run
@@ -64,6 +67,10 @@ async def init_db() -> bool:
                 "pool_recycle": 1800,
                 "pool_timeout": 30,
             })
+            if "asyncpg" in db_url:
+                # Per-connection prepared statements reused across requests
+                # (SQLAlchemy default is 100, too few for the search variants)
+                engine_kwargs["connect_args"] = {"prepared_statement_cache_size": 500}
 
         engine = create_async_engine(db_url, **engine_kwargs)
 
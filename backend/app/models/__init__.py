@@ -7,6 +7,7 @@ from app.models.decision import (
     ActNormativ,
     LegislatieFragment,
     SearchScope,
+    RAGResponseCache,
     User,
     Conversatie,
     MesajConversatie,
@@ -31,6 +32,7 @@ __all__ = [
     "ActNormativ",
     "LegislatieFragment",
     "SearchScope",
+    "RAGResponseCache",
     "User",
     "Conversatie",
     "MesajConversatie",
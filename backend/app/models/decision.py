@@ -12,8 +12,8 @@ from uuid import uuid4
 
 from pgvector.sqlalchemy import Vector
 from sqlalchemy import (
-    Boolean, JSON, Date, DateTime, Float, ForeignKey, Index, Integer, Numeric,
-    String, Text, func,
+    Boolean, JSON, Computed, Date, DateTime, Float, ForeignKey, Index, Integer,
+    Numeric, String, Text, func,
 )
 from sqlalchemy.dialects.postgresql import UUID, ARRAY, JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -99,9 +99,20 @@ class DecizieCNSC(Base):
     autoritate_contractanta: Mapped[Optional[str]] = mapped_column(String(500))
     intervenienti: Mapped[Optional[list]] = mapped_column(JSON, default=list)
 
-    # Full content
+    # Full content (lz4 TOAST compression, set in migration 20261015_0008)
     text_integral: Mapped[str] = mapped_column(Text, nullable=False)
 
+    # Full-text search vector maintained by Postgres (deferred: never needed in Python)
+    search_vec: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple', coalesce(text_integral, '') || ' ' || "
+            "coalesce(contestator, '') || ' ' || coalesce(autoritate_contractanta, ''))",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
     # Extracted contract object (from parser, introductory section)
     obiect_contract: Mapped[Optional[str]] = mapped_column(Text)
 
@@ -130,9 +141,23 @@ class DecizieCNSC(Base):
         Index("ix_decizii_cpv", cod_cpv),
         Index("ix_decizii_solutie", solutie_contestatie),
         Index("ix_decizii_data", data_decizie),
+        # Matches ORDER BY data_decizie DESC NULLS LAST ... LIMIT in the RAG searches
+        Index("ix_decizii_data_desc", data_decizie.desc().nulls_last()),
         Index("ix_decizii_complet", complet),
         Index("ix_decizii_fulltext", text_integral, postgresql_using="gin",
               postgresql_ops={"text_integral": "gin_trgm_ops"}),
+        # Trigram indexes so every ILIKE branch of the keyword search is indexed
+        Index("ix_decizii_contestator_trgm", contestator, postgresql_using="gin",
+              postgresql_ops={"contestator": "gin_trgm_ops"}),
+        Index("ix_decizii_autoritate_trgm", autoritate_contractanta, postgresql_using="gin",
+              postgresql_ops={"autoritate_contractanta": "gin_trgm_ops"}),
+        Index("ix_decizii_filename_trgm", filename, postgresql_using="gin",
+              postgresql_ops={"filename": "gin_trgm_ops"}),
+        Index("ix_decizii_cpv_descriere_trgm", cpv_descriere, postgresql_using="gin",
+              postgresql_ops={"cpv_descriere": "gin_trgm_ops"}),
+        Index("ix_decizii_cpv_clasa_trgm", cpv_clasa, postgresql_using="gin",
+              postgresql_ops={"cpv_clasa": "gin_trgm_ops"}),
+        Index("ix_decizii_search_vec", search_vec, postgresql_using="gin"),
         Index("ix_decizii_bo_unique", an_bo, numar_bo, unique=True),
     )
 
@@ -523,6 +548,50 @@ class SearchScope(Base):
         return f"<SearchScope '{self.name}' ({self.decision_count} decizii)>"
 
 
+# =============================================================================
+# RAG RESPONSE CACHE (semantic cache keyed on query embedding)
+# =============================================================================
+
+class RAGResponseCache(Base):
+    """Cached RAG answer, looked up by similarity of the query embedding.
+
+    Near-duplicate questions asked with the same retrieval parameters and
+    model (params_hash) reuse the stored answer instead of re-running
+    retrieval and the LLM call. See app/services/semantic_cache.py.
+    """
+
+    __tablename__ = "rag_response_cache"
+
+    id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        primary_key=True,
+        default=lambda: str(uuid4())
+    )
+
+    # SHA-256 of model + retrieval params (scope, rerank, expansion, memory)
+    params_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    query_text: Mapped[str] = mapped_column(Text, nullable=False)
+    embedding: Mapped[list] = mapped_column(Vector(2000), nullable=False)
+
+    # {"response": str, "citations": [...], "confidence": float, "suggested_questions": [...]}
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        Index("ix_rag_cache_params", params_hash, created_at),
+        Index(
+            "ix_rag_cache_embedding_hnsw",
+            embedding,
+            postgresql_using="hnsw",
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+            postgresql_with={"m": 16, "ef_construction": 64},
+        ),
+    )
+
+
 # =============================================================================
 # USERS (pregătit pentru auth multi-user viitor)
 # =============================================================================
@@ -15,13 +15,16 @@ recommendations for fixing non-compliant items.
 """
 
 import asyncio
+import hashlib
 import json
 import re
 from typing import Optional
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from app.core.logging import get_logger
+from app.core.redis import cache_get_json, cache_set_json
 from app.models.decision import LegislatieFragment, ActNormativ, ArgumentareCritica, DecizieCNSC
 from app.services.embedding import EmbeddingService
 from app.services.llm.base import LLMProvider
@@ -32,10 +35,16 @@ logger = get_logger(__name__)
 MAX_CONCURRENT_CHECKS = 6
 LLM_CALL_TIMEOUT = 120
 MAX_REQUIREMENTS = 15  # Cap on number of requirements to check
+JURISPRUDENCE_CACHE_TTL = 86400  # 1 day — decisions are imported in batches
 # No artificial truncation — LLM providers handle context limits internally
 # via token-aware truncation (~4 chars/token). Gemini supports 1M tokens.
 
 
+def _jurisprudence_cache_key(query_text: str) -> str:
+    h = hashlib.sha256(query_text.encode()).hexdigest()[:16]
+    return f"expertap:compliance:juris:{h}"
+
+
 class ComplianceChecker:
     """Service for checking procurement document compliance against legislation."""
 
@@ -89,17 +98,42 @@ class ComplianceChecker:
             }
 
         # --- Pass 2: Check compliance per requirement ---
-        # Phase 2a: Fetch jurisprudence context (sequential DB)
+        # Phase 2a: Fetch jurisprudence context. Results are cached per
+        # requirement query, so re-checking a document skips both the
+        # embedding and the DB round trip; misses are embedded in one batch
+        # and searched sequentially (shared session).
         context_map = {}
-        for req in requirements:
-            query_vector = await self.embedding_service.embed_query(
-                f"{req['citare']} {req['descriere'][:200]}"
-            )
-            # Find relevant CNSC decisions for this requirement
-            jurisprudence = await self._search_related_decisions(
-                session, query_vector, limit=3,
-            )
-            context_map[req["citare"]] = jurisprudence
+        queries = {
+            req["citare"]: f"{req['citare']} {req['descriere'][:200]}"
+            for req in requirements
+        }
+        cached = await asyncio.gather(
+            *(cache_get_json(_jurisprudence_cache_key(q)) for q in queries.values())
+        )
+        misses = []
+        for (citare, query_text), hit in zip(queries.items(), cached):
+            if hit is not None:
+                context_map[citare] = hit
+            else:
+                misses.append((citare, query_text))
+
+        if misses:
+            vectors = await self.embedding_service.embed_queries([q for _, q in misses])
+            for (citare, query_text), query_vector in zip(misses, vectors):
+                # Find relevant CNSC decisions for this requirement
+                jurisprudence = await self._search_related_decisions(
+                    session, query_vector, limit=3,
+                )
+                context_map[citare] = jurisprudence
+                await cache_set_json(
+                    _jurisprudence_cache_key(query_text), jurisprudence,
+                    ttl_seconds=JURISPRUDENCE_CACHE_TTL,
+                )
+        logger.info(
+            "compliance_jurisprudence_fetched",
+            requirements=len(queries),
+            cache_hits=len(queries) - len(misses),
+        )
 
         # Phase 2b: Parallel LLM compliance checks
         semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHECKS)
@@ -395,7 +429,6 @@ Răspunde în JSON:
         if not relevant:
             return []
 
-        from sqlalchemy.orm import defer
         dec_ids = list({a.decizie_id for a, _ in relevant})
         dec_result = await session.execute(
             select(DecizieCNSC).options(defer(DecizieCNSC.text_integral)).where(DecizieCNSC.id.in_(dec_ids))
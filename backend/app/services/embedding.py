@@ -114,6 +114,27 @@ class EmbeddingService:
 
         return embedding
 
+    async def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """Embed several search queries with a single API call.
+
+        Queries already in the Redis cache are served from it; the misses
+        are sent together as one batched request instead of one request
+        per query, then cached like ``embed_query`` results.
+        """
+        from app.core.redis import cache_get_embedding, cache_set_embedding
+
+        cached = await asyncio.gather(*(cache_get_embedding(t) for t in texts))
+        misses = list(dict.fromkeys(t for t, v in zip(texts, cached) if v is None))
+
+        fresh: dict[str, list[float]] = {}
+        if misses:
+            vectors = await self.embed_batch(misses, task_type="retrieval_query")
+            fresh = dict(zip(misses, vectors))
+            await asyncio.gather(*(cache_set_embedding(t, v) for t, v in fresh.items()))
+
+        logger.debug("embedding_queries_batched", total=len(texts), embedded=len(misses))
+        return [v if v is not None else fresh[t] for t, v in zip(texts, cached)]
+
     async def embed_batch(
         self,
         texts: list[str],
@@ -62,8 +62,9 @@ class AnthropicProvider(LLMProvider):
         system_prompt: str | None = None,
         temperature: float = 0.1,
         max_tokens: int = 4096,
+        json_mode: bool = False,
     ) -> str:
-        """Generate a completion using Claude."""
+        """Generate a completion using Claude (no native JSON mode; json_mode is ignored)."""
         messages = self._build_messages(prompt, context)
 
         try:
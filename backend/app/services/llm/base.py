@@ -33,6 +33,7 @@ class LLMProvider(ABC):
         system_prompt: str | None = None,
         temperature: float = 0.1,
         max_tokens: int = 4096,
+        json_mode: bool = False,
     ) -> str:
         """Generate a completion for the given prompt.
 
@@ -42,6 +43,9 @@ class LLMProvider(ABC):
             system_prompt: Optional system instruction.
             temperature: Controls randomness (0.0 = deterministic, 1.0 = creative).
             max_tokens: Maximum tokens in the response.
+            json_mode: Ask the model for a bare JSON document. Providers
+                without a native JSON mode ignore it and rely on the prompt,
+                so callers must still tolerate fenced output.
 
         Returns:
             The generated text response.
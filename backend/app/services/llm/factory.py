@@ -7,6 +7,7 @@ Provides functions to get LLM providers:
 - clear_provider_cache() — invalidate cached providers after settings change
 """
 
+import hashlib
 from typing import Literal
 
 from sqlalchemy import select
@@ -51,24 +52,15 @@ def get_llm_provider(
     if provider_type is None:
         provider_type = _detect_available_provider(settings)
 
-    # When api_key is provided, skip cache (per-request key from DB)
-    if api_key:
-        provider = _create_provider(provider_type, api_key=api_key, **kwargs)
-        logger.info(
-            "llm_provider_created",
-            provider=provider.provider_name,
-            model=provider.model_name,
-            cached=False,
-        )
-        return provider
-
-    # Check cache
-    cache_key = f"{provider_type}:{kwargs.get('model', 'default')}"
+    # Check cache. DB-configured keys are part of the key (hashed, never
+    # stored in clear) so requests reuse one client — and its HTTP
+    # connection pool — instead of building a new provider every time.
+    cache_key = f"{provider_type}:{kwargs.get('model', 'default')}:{_key_fingerprint(api_key)}"
     if cache_key in _provider_cache:
         return _provider_cache[cache_key]
 
     # Create provider
-    provider = _create_provider(provider_type, **kwargs)
+    provider = _create_provider(provider_type, api_key=api_key, **kwargs)
     _provider_cache[cache_key] = provider
 
     logger.info(
@@ -151,18 +143,24 @@ def get_embedding_provider(api_key: str | None = None) -> LLMProvider:
     Returns:
         GeminiProvider configured for embeddings.
     """
-    cache_key = "embedding:gemini"
-    if not api_key and cache_key in _provider_cache:
+    cache_key = f"embedding:gemini:{_key_fingerprint(api_key)}"
+    if cache_key in _provider_cache:
         return _provider_cache[cache_key]
 
     from app.services.llm.gemini import GeminiProvider
 
     provider = GeminiProvider(api_key=api_key) if api_key else GeminiProvider()
-    if not api_key:
-        _provider_cache[cache_key] = provider
+    _provider_cache[cache_key] = provider
     return provider
 
 
+def _key_fingerprint(api_key: str | None) -> str:
+    """Short, non-reversible cache-key component for an API key."""
+    if not api_key:
+        return "env"
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
 def _detect_available_provider(settings) -> ProviderType:
     """Detect which provider is available based on configuration."""
     if settings.gemini_api_key:
@@ -80,6 +80,7 @@ class GeminiProvider(LLMProvider):
         system_prompt: str | None = None,
         temperature: float = 0.1,
         max_tokens: int = 4096,
+        json_mode: bool = False,
     ) -> str:
         """Generate a completion using Gemini."""
         full_prompt = self._build_prompt(prompt, context, system_prompt)
@@ -92,6 +93,7 @@ class GeminiProvider(LLMProvider):
                 config=types.GenerateContentConfig(
                     temperature=temperature,
                     max_output_tokens=safe_tokens,
+                    response_mime_type="application/json" if json_mode else None,
                 ),
             )
 
@@ -176,8 +176,14 @@ class GroqProvider(LLMProvider):
         system_prompt: str | None = None,
         temperature: float = 0.1,
         max_tokens: int = 4096,
+        json_mode: bool = False,
     ) -> str:
-        """Generate a completion using Groq."""
+        """Generate a completion using Groq.
+
+        json_mode is not forwarded: Groq rejects (400) any JSON-mode output
+        that fails validation, including replies cut off by max_tokens,
+        which the callers' JSON repair would otherwise recover.
+        """
         messages = self._build_messages(prompt, context, system_prompt)
         safe_max_tokens = self._get_max_output_tokens(max_tokens)
 
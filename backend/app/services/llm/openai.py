@@ -75,16 +75,20 @@ class OpenAIProvider(LLMProvider):
         system_prompt: str | None = None,
         temperature: float = 0.1,
         max_tokens: int = 4096,
+        json_mode: bool = False,
     ) -> str:
         """Generate a completion using OpenAI."""
         messages = self._build_messages(prompt, context, system_prompt)
 
+        extra = {"response_format": {"type": "json_object"}} if json_mode else {}
+
         try:
             response = await self._client.chat.completions.create(
                 model=self._model_name,
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
+                **extra,
             )
 
             content = response.choices[0].message.content
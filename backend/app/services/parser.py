@@ -11,12 +11,15 @@ Example:
 """
 
 import hashlib
+import os
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Iterable, Iterator, Literal, Optional
 
 from app.core.logging import get_logger
 
@@ -61,15 +64,22 @@ CRITICISM_CODES_LEGEND = {
 }
 
 
+# Code (and bare prefix letter) -> contest type, for single-probe lookups
+_CODE_TO_TYPE = {
+    code: CriticismCodeType.DOCUMENTATION if code[0] == "D" else CriticismCodeType.RESULT
+    for code in (*CRITICISM_CODES_LEGEND, "D", "R")
+}
+
+
 def get_criticism_type(code: str) -> CriticismCodeType:
     """Determine contest type from criticism code."""
-    code_upper = code.upper()
-    if code_upper.startswith("D"):
-        return CriticismCodeType.DOCUMENTATION
-    elif code_upper.startswith("R"):
-        return CriticismCodeType.RESULT
-    else:
-        raise ValueError(f"Unknown criticism code prefix: {code}")
+    code_type = _CODE_TO_TYPE.get(code)
+    if code_type is None:
+        # Lowercase or sub-codes like "R2.2" — classify by prefix letter
+        code_type = _CODE_TO_TYPE.get(code[:1].upper())
+        if code_type is None:
+            raise ValueError(f"Unknown criticism code prefix: {code}")
+    return code_type
 
 
 def get_criticism_description(code: str) -> str:
@@ -197,8 +207,8 @@ class ParsedDecision:
     autoritate_contractanta: Optional[str] = None
     intervenienti: list[str] = field(default_factory=list)
 
-    # Full content
-    text_integral: str = ""
+    # Full content — None when parsed from disk; see load_text()
+    text_integral: Optional[str] = None
 
     # Contract object (extracted from introductory text)
     obiect_contract: Optional[str] = None
@@ -222,6 +232,20 @@ class ParsedDecision:
     source_file: Optional[str] = None
     parse_warnings: list[str] = field(default_factory=list)
 
+    def load_text(self) -> str:
+        """Return text_integral, reading it from source_file on first use.
+
+        Raises:
+            FileNotFoundError: If the text was not kept and source_file is gone.
+        """
+        if self.text_integral is None:
+            if not self.source_file or not Path(self.source_file).is_file():
+                raise FileNotFoundError(
+                    f"Decision text not in memory and source file missing: {self.source_file}"
+                )
+            self.text_integral = _read_decision_text(Path(self.source_file))
+        return self.text_integral
+
     @property
     def external_id(self) -> str:
         """Generate unique external ID."""
@@ -244,6 +268,15 @@ class ParsedDecision:
         return " - ".join(parts)
 
 
+def _read_decision_text(file_path: Path) -> str:
+    """Read a decision file once as bytes and decode it (UTF-8, then latin-1)."""
+    raw = file_path.read_bytes().removeprefix(b"\xef\xbb\xbf")
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return raw.decode("latin-1")
+
+
 # =============================================================================
 # PARSER IMPLEMENTATION
 # =============================================================================
@@ -254,6 +287,97 @@ WORD_TO_NUMBER = {
     "unsprezece": 11, "doisprezece": 12,
 }
 
+# Decision header ("Nr. 3754/C8/4446") is always within the first few KB
+HEADER_WINDOW = 4096
+# Room past HEADER_WINDOW for the rest of a header that starts just inside it
+HEADER_OVERHANG = 64
+
+# Distinct codes the "criticism" text pattern can match: D1-D8, R1-R8, DAL, RAL
+MAX_TEXT_CRITICISM_CODES = 18
+
+# Every whitespace code point other than the space itself (the set str.isspace
+# and \s match) mapped to a plain space for party-name cleanup
+_WS_TRANS = dict.fromkeys(
+    [
+        *range(0x09, 0x0E),  # \t \n \v \f \r
+        *range(0x1C, 0x20),  # file/group/record/unit separators
+        0x85, 0xA0, 0x1680,  # next line, no-break space, ogham space mark
+        *range(0x2000, 0x200B),  # en quad .. hair space
+        0x2028, 0x2029, 0x202F, 0x205F, 0x3000,
+    ],
+    " ",
+)
+
+# Procedure-type pattern keys and their canonical codes, in priority order
+PROCEDURE_TYPES = (
+    ("proc_licitatie_deschisa", "licitatie_deschisa"),
+    ("proc_licitatie_restransa", "licitatie_restransa"),
+    ("proc_negociere_competitiva", "negociere_competitiva"),
+    ("proc_dialog_competitiv", "dialog_competitiv"),
+    ("proc_parteneriat_inovare", "parteneriat_inovare"),
+    ("proc_negociere_fara_publicare", "negociere_fara_publicare"),
+    ("proc_negociere_fara_invitatie", "negociere_fara_invitatie"),
+    ("proc_negociere_fara_anunt", "negociere_fara_anunt"),
+    ("proc_concurs_solutii", "concurs_solutii"),
+    ("proc_servicii_sociale", "servicii_sociale"),
+    ("proc_simplificata", "procedura_simplificata"),
+)
+_PROCEDURE_RANK = {code: i for i, (_, code) in enumerate(PROCEDURE_TYPES)}
+
+
+def _build_procedure_re(patterns: dict[str, re.Pattern]) -> re.Pattern:
+    """Join the procedure-type patterns into one named-group alternation.
+
+    Every pattern must start with a literal, non-optional letter; the
+    lookahead on those letters lets the scan skip other positions without
+    trying each branch.
+
+    Raises:
+        ValueError: If a pattern could match starting with anything else,
+            which the lookahead would otherwise hide.
+    """
+    sources = [patterns[key].pattern for key, _ in PROCEDURE_TYPES]
+    for (key, _), src in zip(PROCEDURE_TYPES, sources):
+        if not src[:1].isalpha() or src[1:2] in ("?", "*", "{"):
+            raise ValueError(f"Procedure pattern {key!r} must start with a literal letter: {src!r}")
+    first_chars = "".join(sorted({src[0] for src in sources}))
+    alternation = "|".join(
+        f"(?P<{code}>{src})" for (_, code), src in zip(PROCEDURE_TYPES, sources)
+    )
+    return re.compile(f"(?=[{first_chars}])(?:{alternation})", re.IGNORECASE)
+
+
+# Helper patterns used inside the extractors, compiled once at import
+_WS_RUN_RE = re.compile(r"\s+")
+_DASH_RE = re.compile(r"[–—]")
+# Legea 101/2016 full title (mentions sectoriale + concesiuni — false positives)
+_LEGEA_101_TITLE_RE = re.compile(
+    r"Leg(?:ea|ii)\s+(?:nr\.?\s*)?101/2016\s+privind\s+remediile.*?"
+    r"Contestați(?:i|ilor)",
+    re.IGNORECASE | re.DOTALL,
+)
+# Note: both ș (U+0219) and ş (U+015F, cedilla) variants exist in texts.
+_SECTORIALE_CONCESIUNI_ENUM_RE = re.compile(
+    r"(?:contracte(?:lor)?(?:/acorduri(?:lor)?[\s\-]*cadru)?\s+)?sectoriale\s+"
+    r"[sșş]i\s+a\s+(?:contractelor\s+)?(?:de\s+)?concesiun[eă]\s+"
+    r"de\s+lucrări\s+[sșş]i\s+(?:de\s+)?concesiun[eă]\s+de\s+servicii",
+    re.IGNORECASE,
+)
+_CONCESIUNI_ENUM_RE = re.compile(
+    r"concesiun[eă]\s+de\s+lucrări\s+[sșş]i\s+(?:de\s+)?concesiun[eă]\s+de\s+servicii",
+    re.IGNORECASE,
+)
+# Literal tails of the legea_98/99/100 patterns (substring pre-checks)
+_LAW_ANCHORS = ("98/2016", "99/2016", "100/2016")
+# Anonymized party-name detection
+_COMPANY_PREFIX_RE = re.compile(r"^\s*S\.?C\.?\s*", re.IGNORECASE)
+_COMPANY_SUFFIX_RE = re.compile(
+    r"\s*(?:S\.?R\.?L\.?|S\.?A\.?|S\.?C\.?|S\.?N\.?C\.?|R\.?A\.?)\s*$",
+    re.IGNORECASE,
+)
+_PAREN_PLACEHOLDER_RE = re.compile(r"[(\[{][\s.…·•_x*]+[)\]}]", re.IGNORECASE)
+_ANON_CHARS_ONLY_RE = re.compile(r"[.\s…·•x_*()]+", re.IGNORECASE)
+
 # Canonical forms for award criteria
 CRITERIU_CANONICAL = {
     "calitate-preț": "cel mai bun raport calitate-preț",
@@ -329,13 +453,16 @@ class CNSCDecisionParser:
             re.IGNORECASE
         ),
 
-        # Parties
+        # Parties — name runs until newline or ", în". Commas are consumed only
+        # when not followed by "în", so the engine never re-splits the line
+        # (no lazy-quantifier backtracking on long header lines).
         "contestator": re.compile(
-            r"(?:Contestator|Petent)[:\s]+([^\n]+?)(?:\n|,\s*în)",
+            r"(?:Contestator|Petent)[:\s]+([^\n,]+(?:,(?!\s*în)[^\n,]*)*)(?:\n|,\s*în)",
             re.IGNORECASE
         ),
         "authority": re.compile(
-            r"(?:Autoritate(?:\s+contractantă)?|Intimat)[:\s]+([^\n]+?)(?:\n|,\s*în)",
+            r"(?:Autoritate(?:\s+contractantă)?|Intimat)[:\s]+"
+            r"([^\n,]+(?:,(?!\s*în)[^\n,]*)*)(?:\n|,\s*în)",
             re.IGNORECASE
         ),
 
@@ -500,6 +627,9 @@ class CNSCDecisionParser:
         ),
     }
 
+    # All procedure-type patterns as one alternation (group name = code)
+    _PROCEDURE_RE = _build_procedure_re(PATTERNS)
+
     # Section markers
     SECTION_MARKERS = {
         SectionType.DISPOSITIVE: [
@@ -524,6 +654,18 @@ class CNSCDecisionParser:
         ],
     }
 
+    # Single alternation over the dispositive markers — one scan instead of
+    # one str.find per marker; returns the earliest marker in the text.
+    _DISPOSITIVE_RE = re.compile(
+        "|".join(re.escape(m) for m in SECTION_MARKERS[SectionType.DISPOSITIVE])
+    )
+
+    # All known rejection reasons in one pass over the dispositive window
+    _REJECTION_REASONS_RE = re.compile(
+        r"\b(" + "|".join(re.escape(r) for r in REJECTION_REASONS) + r")\b",
+        re.IGNORECASE
+    )
+
     MONTH_MAP = {
         "ianuarie": 1, "februarie": 2, "martie": 3, "aprilie": 4,
         "mai": 5, "iunie": 6, "iulie": 7, "august": 8,
@@ -548,30 +690,35 @@ class CNSCDecisionParser:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        # Read file content
-        try:
-            content = file_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            content = file_path.read_text(encoding="latin-1")
+        content = _read_decision_text(file_path)
 
-        return self.parse_text(content, source_file=str(file_path))
+        # The text can be re-read from disk, so don't keep a second copy
+        return self.parse_text(content, source_file=str(file_path), keep_text=False)
 
     def parse_text(
         self,
         text: str,
         source_file: Optional[str] = None,
+        keep_text: bool = True,
     ) -> ParsedDecision:
         """Parse a CNSC decision from raw text.
 
         Args:
             text: The raw text content of the decision.
             source_file: Optional source file path for reference.
+            keep_text: Keep the text in memory as text_integral. When False and
+                source_file exists on disk, text_integral is left as None and
+                load_text() reads it back on demand.
 
         Returns:
             ParsedDecision with extracted metadata.
         """
         warnings: list[str] = []
 
+        text_integral: Optional[str] = text
+        if not keep_text and source_file and Path(source_file).is_file():
+            text_integral = None
+
         # Stage 1: Parse filename metadata
         filename_meta = None
         if source_file:
@@ -591,7 +738,7 @@ class CNSCDecisionParser:
                 cod_cpv=filename_meta.cod_cpv,
                 cpv_source="filename" if filename_meta.cod_cpv else "text_explicit",
                 solutie_filename=filename_meta.solutie,
-                text_integral=text,
+                text_integral=text_integral,
                 source_file=source_file,
             )
         else:
@@ -600,7 +747,7 @@ class CNSCDecisionParser:
                 filename=Path(source_file).name if source_file else "unknown.txt",
                 numar_bo=0,
                 an_bo=0,
-                text_integral=text,
+                text_integral=text_integral,
                 source_file=source_file,
             )
 
@@ -621,7 +768,7 @@ class CNSCDecisionParser:
 
         decision.parse_warnings = warnings
 
-        logger.info(
+        logger.debug(
             "decision_parsed",
             external_id=decision.external_id,
             tip_contestatie=decision.tip_contestatie.value,
@@ -671,16 +818,14 @@ class CNSCDecisionParser:
                 cod_cpv = None
                 solutie_str = match.group(4).upper()
 
-        # Parse criticism codes (e.g., "D1_D4" -> ["D1", "D4"])
+        # Parse criticism codes (e.g., "D1_D4" -> ["D1", "D4"]) and contest type
         # "NA" means no specific criticism codes — valid for some decisions
-        coduri_critici = self._parse_criticism_codes_from_filename(critici_str)
+        critici_upper = critici_str.upper()
+        coduri_critici, tip_contestatie = self._scan_critici(critici_upper)
 
-        if not coduri_critici and critici_str.upper() != "NA":
+        if not coduri_critici and critici_upper != "NA":
             raise ValueError(f"No valid criticism codes found in: {critici_str}")
 
-        # Determine contest type from criticism codes (or from solutie if NA)
-        tip_contestatie = self._determine_contest_type(coduri_critici)
-
         # Parse solution code
         solutie = SolutionCode(solutie_str) if solutie_str in "ARX" else SolutionCode.UNKNOWN
 
@@ -694,8 +839,8 @@ class CNSCDecisionParser:
             filename=filename,
         )
 
-    def _parse_criticism_codes_from_filename(self, critici_str: str) -> list[str]:
-        """Parse criticism codes from filename segment.
+    def _scan_critici(self, critici_str: str) -> tuple[list[str], CriticismCodeType]:
+        """Parse criticism codes from filename segment in a single pass.
 
         Handles various formats found in real CNSC filenames:
             "R2" -> ["R2"]
@@ -705,43 +850,38 @@ class CNSCDecisionParser:
             "R4.3" -> ["R4"]  (sub-point stripped)
             "RA" -> ["RAL"]  (shorthand expanded)
             "DA" -> ["DAL"]  (shorthand expanded)
+
+        Expects an already uppercased segment. Returns the codes together with
+        the contest type deduced from the first code (documentatie if none).
         """
-        # Split by underscore first, then by comma
-        raw_parts = critici_str.upper().split("_")
-        parts = []
-        for raw in raw_parts:
-            parts.extend(raw.split(","))
-
-        # Normalize and filter valid codes
-        valid_codes = []
-        seen = set()
-        for part in parts:
-            part = part.strip()
-            if not part:
+        valid_codes: list[str] = []
+        n = len(critici_str)
+        i = 0
+        while i < n:
+            # Token runs until the next "_" or "," separator
+            j = i
+            while j < n and critici_str[j] != "_" and critici_str[j] != ",":
+                j += 1
+            part = critici_str[i:j].strip()
+            i = j + 1
+
+            if len(part) < 2 or part[0] not in "DR":
                 continue
 
-            # Expand shorthands: RA -> RAL, DA -> DAL
-            if part == "RA":
-                part = "RAL"
-            elif part == "DA":
-                part = "DAL"
-
-            # Check for exact match first (D1-D8, R1-R8, DAL, RAL)
-            if re.match(r"^[DR][1-8]$|^DAL$|^RAL$", part):
-                if part not in seen:
-                    valid_codes.append(part)
-                    seen.add(part)
+            if part[1] in "12345678":
+                # D1-D8, R1-R8, with optional sub-points (R2.2.2 -> R2)
+                code = part[:2]
+            elif part == "RA" or part == "DA" or part == "RAL" or part == "DAL":
+                code = part[0] + "AL"
+            else:
                 continue
 
-            # Handle sub-points: R2.2.2 -> R2, R4.3 -> R4, D1.1 -> D1
-            base_match = re.match(r"^([DR])(\d)", part)
-            if base_match:
-                base_code = base_match.group(1) + base_match.group(2)
-                if re.match(r"^[DR][1-8]$", base_code) and base_code not in seen:
-                    valid_codes.append(base_code)
-                    seen.add(base_code)
+            if code not in valid_codes:
+                valid_codes.append(code)
 
-        return valid_codes
+        if valid_codes and valid_codes[0][0] == "R":
+            return valid_codes, CriticismCodeType.RESULT
+        return valid_codes, CriticismCodeType.DOCUMENTATION
 
     def _determine_contest_type(self, coduri_critici: list[str]) -> CriticismCodeType:
         """Determine contest type from criticism codes.
@@ -749,13 +889,9 @@ class CNSCDecisionParser:
         D* codes -> documentatie
         R* codes -> rezultat
 
-        If mixed, use the first code's type.
+        If mixed, use the first code's type. Codes must be uppercase.
         """
-        if not coduri_critici:
-            return CriticismCodeType.DOCUMENTATION
-
-        first_code = coduri_critici[0].upper()
-        if first_code.startswith("R"):
+        if coduri_critici and coduri_critici[0][0] == "R":
             return CriticismCodeType.RESULT
         return CriticismCodeType.DOCUMENTATION
 
@@ -763,7 +899,14 @@ class CNSCDecisionParser:
         """Extract metadata from decision text."""
 
         # Extract decision number header: "Nr. 3754/C8/4446"
-        match = self.PATTERNS["decision_header"].search(text)
+        # The header sits near the top; searching only the first few KB skips
+        # the full-text scan and avoids matching citations of other decisions.
+        # A header starting inside the window may run past its edge, so the
+        # search overhangs it and the hit is re-matched without an end bound.
+        header_re = self.PATTERNS["decision_header"]
+        match = header_re.search(text, 0, HEADER_WINDOW + HEADER_OVERHANG)
+        if match:
+            match = header_re.match(text, match.start()) if match.start() < HEADER_WINDOW else None
         if match:
             # Validate numar_bo matches filename
             text_numar_bo = int(match.group(1))
@@ -782,15 +925,23 @@ class CNSCDecisionParser:
 
         # Extract CPV if not from filename
         if not decision.cod_cpv:
-            cpv_matches = self.PATTERNS["cpv"].findall(text)
-            if cpv_matches:
-                decision.cod_cpv = cpv_matches[0]  # First CPV found
+            # Only the first CPV is used — stop at it instead of findall()
+            cpv_match = self.PATTERNS["cpv"].search(text)
+            if cpv_match:
+                decision.cod_cpv = cpv_match.group(1)
                 decision.cpv_source = "text_explicit"
 
         # Extract criticism codes from text if not from filename
         if not decision.coduri_critici:
-            text_codes = self.PATTERNS["criticism"].findall(text)
-            decision.coduri_critici = list(dict.fromkeys([c.upper() for c in text_codes]))
+            # Ordered dedupe while scanning; stop once every possible code was seen
+            seen: dict[str, None] = {}
+            for code_match in self.PATTERNS["criticism"].finditer(text):
+                code = code_match.group(1).upper()
+                if code not in seen:
+                    seen[code] = None
+                    if len(seen) == MAX_TEXT_CRITICISM_CODES:
+                        break
+            decision.coduri_critici = list(seen)
             if decision.coduri_critici:
                 decision.tip_contestatie = self._determine_contest_type(decision.coduri_critici)
 
@@ -849,8 +1000,8 @@ class CNSCDecisionParser:
         if match:
             raw = match.group(1).strip().lower()
             # Normalize to canonical form
-            raw_normalized = re.sub(r"\s+", " ", raw)
-            raw_normalized = re.sub(r"[–—]", "-", raw_normalized)
+            raw_normalized = _WS_RUN_RE.sub(" ", raw)
+            raw_normalized = _DASH_RE.sub("-", raw_normalized)
             if "calitate" in raw_normalized and "cost" in raw_normalized:
                 return "cel mai bun raport calitate-cost"
             elif "calitate" in raw_normalized and "preț" in raw_normalized:
@@ -967,52 +1118,40 @@ class CNSCDecisionParser:
         Note: Legea 101/2016 (remedii) mentions all three domains in its title,
         so we exclude occurrences within the standard Legea 101 preamble.
         """
-        # Remove ALL references to Legea 101/2016 full title which mentions
-        # "contracte sectoriale" and "concesiune de lucrări/servicii" — false positives.
-        cleaned = re.sub(
-            r"Leg(?:ea|ii)\s+(?:nr\.?\s*)?101/2016\s+privind\s+remediile.*?"
-            r"Contestați(?:i|ilor)",
-            "",
-            text,
-            flags=re.IGNORECASE | re.DOTALL
-        )
-        # Remove the standard legal enumeration "concesiune de lucrări și concesiune
-        # de servicii" which appears in Legea 101 citations, ANAP references, etc.
-        # Note: both ș (U+0219) and ş (U+015F, cedilla) variants exist in texts.
-        search_text = re.sub(
-            r"(?:contracte(?:lor)?(?:/acorduri(?:lor)?[\s\-]*cadru)?\s+)?sectoriale\s+"
-            r"[sșş]i\s+a\s+(?:contractelor\s+)?(?:de\s+)?concesiun[eă]\s+"
-            r"de\s+lucrări\s+[sșş]i\s+(?:de\s+)?concesiun[eă]\s+de\s+servicii",
-            "",
-            cleaned,
-            flags=re.IGNORECASE
-        )
-        # Also catch standalone "concesiune de lucrări și concesiune de servicii"
-        search_text = re.sub(
-            r"concesiun[eă]\s+de\s+lucrări\s+[sșş]i\s+(?:de\s+)?concesiun[eă]\s+de\s+servicii",
-            "",
-            search_text,
-            flags=re.IGNORECASE
-        )
-
-        # If Legea 98/2016 or HG 395/2016 is explicitly invoked, it's achiziții publice
+        # Every law/HG pattern ends in a literal "NNN/2016"; a plain substring
+        # check rules most of them out without running the regex at all.
+        # If HG 395/2016 is explicitly invoked, it's achiziții publice
         # — cannot be concesiuni or sectoriale
-        has_legea_98 = self.PATTERNS["legea_98"].search(search_text)
-        has_hg_395 = self.PATTERNS["hg_395"].search(text)
-
-        if not has_legea_98 and not has_hg_395:
+        if "395/2016" in text and self.PATTERNS["hg_395"].search(text):
+            return "achizitii_publice"
+
+        # The cleanup below only matters when a law reference can match
+        if any(anchor in text for anchor in _LAW_ANCHORS):
+            # Remove ALL references to Legea 101/2016 full title which mentions
+            # "contracte sectoriale" and "concesiune de lucrări/servicii" — false positives.
+            cleaned = _LEGEA_101_TITLE_RE.sub("", text) if "101/2016" in text else text
+            # Remove the standard legal enumeration "concesiune de lucrări și concesiune
+            # de servicii" which appears in Legea 101 citations, ANAP references, etc.
+            search_text = _SECTORIALE_CONCESIUNI_ENUM_RE.sub("", cleaned)
+            # Also catch standalone "concesiune de lucrări și concesiune de servicii"
+            search_text = _CONCESIUNI_ENUM_RE.sub("", search_text)
+
+            # Legea 98/2016 explicitly invoked → achiziții publice.
             # Only check for L99/L100 if L98 is NOT present.
             # Use only explicit law/HG references — keyword-based detection
             # ("concesiune de lucrări", "contracte sectoriale") gives too many
             # false positives from legal enumerations and citations.
-            if self.PATTERNS["legea_100"].search(search_text):
+            if "98/2016" in search_text and self.PATTERNS["legea_98"].search(search_text):
+                return "achizitii_publice"
+
+            if "100/2016" in search_text and self.PATTERNS["legea_100"].search(search_text):
                 return "concesiuni"
 
-            if self.PATTERNS["legea_99"].search(search_text):
+            if "99/2016" in search_text and self.PATTERNS["legea_99"].search(search_text):
                 return "achizitii_sectoriale"
 
-            if self.PATTERNS["hg_394"].search(text):
-                return "achizitii_sectoriale"
+        if "394/2016" in text and self.PATTERNS["hg_394"].search(text):
+            return "achizitii_sectoriale"
 
         # Default: achiziții publice (Legea 98/2016)
         return "achizitii_publice"
@@ -1023,26 +1162,17 @@ class CNSCDecisionParser:
         Searches for procedure type mentions like "procedura simplificată",
         "licitație deschisă", etc. Returns canonical code.
         """
-        # Map pattern keys to canonical procedure codes
-        procedure_patterns = [
-            ("proc_licitatie_deschisa", "licitatie_deschisa"),
-            ("proc_licitatie_restransa", "licitatie_restransa"),
-            ("proc_negociere_competitiva", "negociere_competitiva"),
-            ("proc_dialog_competitiv", "dialog_competitiv"),
-            ("proc_parteneriat_inovare", "parteneriat_inovare"),
-            ("proc_negociere_fara_publicare", "negociere_fara_publicare"),
-            ("proc_negociere_fara_invitatie", "negociere_fara_invitatie"),
-            ("proc_negociere_fara_anunt", "negociere_fara_anunt"),
-            ("proc_concurs_solutii", "concurs_solutii"),
-            ("proc_servicii_sociale", "servicii_sociale"),
-            ("proc_simplificata", "procedura_simplificata"),
-        ]
-
-        for pattern_key, code in procedure_patterns:
-            if self.PATTERNS[pattern_key].search(text):
-                return code
-
-        return None
+        # One scan for all procedure types; the earliest entry in
+        # PROCEDURE_TYPES wins when several are mentioned.
+        best = None
+        for match in self._PROCEDURE_RE.finditer(text):
+            rank = _PROCEDURE_RANK[match.lastgroup]
+            if best is None or rank < best:
+                best = rank
+                if rank == 0:
+                    break
+
+        return PROCEDURE_TYPES[best][1] if best is not None else None
 
     def _extract_parties(self, decision: ParsedDecision, text: str) -> None:
         """Extract parties from text."""
@@ -1070,17 +1200,12 @@ class CNSCDecisionParser:
             return True
         cleaned = text.strip().rstrip(".,;:-–—")
         # Remove common prefixes/suffixes (SC, SRL, SA, etc.) to check core
-        cleaned_core = re.sub(
-            r"^\s*S\.?C\.?\s*", "", cleaned, flags=re.IGNORECASE,
-        )
-        cleaned_core = re.sub(
-            r"\s*(?:S\.?R\.?L\.?|S\.?A\.?|S\.?C\.?|S\.?N\.?C\.?|R\.?A\.?)\s*$",
-            "", cleaned_core, flags=re.IGNORECASE,
-        ).strip()
+        cleaned_core = _COMPANY_PREFIX_RE.sub("", cleaned)
+        cleaned_core = _COMPANY_SUFFIX_RE.sub("", cleaned_core).strip()
         if not cleaned_core:
             return True
         # Detect parenthesized placeholders: (...), (…), (xxx), (___)
-        if re.fullmatch(r"[(\[{][\s.…·•_x*]+[)\]}]", cleaned_core, re.IGNORECASE):
+        if _PAREN_PLACEHOLDER_RE.fullmatch(cleaned_core):
             return True
         # Count anonymization chars vs alphanumeric
         anon_chars = sum(1 for c in cleaned_core if c in ".…·•_()[]{}*")
@@ -1089,14 +1214,16 @@ class CNSCDecisionParser:
         if anon_chars > alnum:
             return True
         # Pure dots/ellipsis/x-es/underscores
-        if re.fullmatch(r"[.\s…·•x_*()]+", cleaned_core, re.IGNORECASE):
+        if _ANON_CHARS_ONLY_RE.fullmatch(cleaned_core):
             return True
         return False
 
     def _clean_party_name(self, name: str) -> str | None:
         """Clean up party name. Returns None if anonymized."""
-        name = name.strip()
-        name = re.sub(r"\s+", " ", name)
+        name = name.translate(_WS_TRANS).strip()
+        # Squash repeated spaces (usually 1-2 passes)
+        while "  " in name:
+            name = name.replace("  ", " ")
         name = name[:500]  # Limit length
         if self._is_anonymized(name):
             return None
@@ -1150,7 +1277,7 @@ class CNSCDecisionParser:
         for CPV deduction via embedding similarity against nomenclator_cpv.
         """
         # Normalize whitespace (line breaks → spaces) for better regex matching
-        intro = re.sub(r"\s+", " ", text[:5000])
+        intro = _WS_RUN_RE.sub(" ", text[:5000])
 
         # Strategy 1: Look for quoted text near markers (most reliable)
         match = self._CONTRACT_OBJECT_QUOTED.search(intro)
@@ -1183,16 +1310,11 @@ class CNSCDecisionParser:
         Looks for "CONSILIUL DECIDE:" marker and extracts the ruling.
         """
         # Find dispositive section
-        dispositive_start = None
-        for marker in self.SECTION_MARKERS[SectionType.DISPOSITIVE]:
-            pos = text.find(marker)
-            if pos != -1:
-                dispositive_start = pos
-                break
-
-        if dispositive_start is None:
+        marker_match = self._DISPOSITIVE_RE.search(text)
+        if marker_match is None:
             return
 
+        dispositive_start = marker_match.start()
         dispositive_text = text[dispositive_start:dispositive_start + 2000]
 
         # Check for partial admission first
@@ -1214,10 +1336,9 @@ class CNSCDecisionParser:
                 decision.motiv_respingere = reason
             else:
                 # Try to find known reason in context
-                for known_reason in REJECTION_REASONS:
-                    if known_reason in dispositive_text.lower():
-                        decision.motiv_respingere = known_reason
-                        break
+                reason_match = self._REJECTION_REASONS_RE.search(dispositive_text)
+                if reason_match:
+                    decision.motiv_respingere = reason_match.group(1).lower()
             return
 
     def _validate_and_reconcile(self, decision: ParsedDecision, warnings: list[str]) -> None:
@@ -1257,12 +1378,12 @@ class CNSCDecisionParser:
         This is a separate method for Stage 3 of the pipeline.
 
         Args:
-            decision: ParsedDecision with text_integral populated.
+            decision: ParsedDecision; its text is loaded from disk if needed.
 
         Returns:
             List of DecisionSection objects.
         """
-        text = decision.text_integral
+        text = decision.load_text()
         sections = []
 
         # Find section boundaries
@@ -1309,6 +1430,35 @@ def parse_decision_file(file_path: Path | str) -> ParsedDecision:
     return parser.parse_file(file_path)
 
 
+def parse_decision_files(
+    paths: Iterable[Path | str],
+    workers: Optional[int] = None,
+) -> Iterator[ParsedDecision]:
+    """Parse many CNSC decision files in parallel.
+
+    Parsing is CPU-bound (regex + decoding), so files are fanned out over
+    a process pool. Results are yielded in the same order as ``paths``.
+    Only a bounded window of files is in flight at once, so a consumer that
+    stops early does not wait for the whole input to be parsed.
+
+    Args:
+        paths: Paths to the .txt files containing the decisions.
+        workers: Number of worker processes (default: CPU count).
+    """
+    max_pending = (workers or os.cpu_count() or 1) * 4
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending = deque()
+    try:
+        for path in paths:
+            pending.append(executor.submit(parse_decision_file, path))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def parse_decision_text(text: str, source_file: Optional[str] = None) -> ParsedDecision:
     """Parse CNSC decision text.
 
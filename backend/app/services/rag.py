@@ -15,12 +15,16 @@ Legislation search is triggered when the query references specific legal
 articles (e.g., "art. 2 alin. 3 lit. b din HG 395").
 """
 
+import heapq
 import re
+import time
 from typing import Optional
 from sqlalchemy import select, or_, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 from pydantic import BaseModel
 
+from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.models.decision import (
     DecizieCNSC, ArgumentareCritica, NomenclatorCPV,
@@ -29,9 +33,60 @@ from app.models.decision import (
 from app.services.embedding import EmbeddingService
 from app.services.llm.base import LLMProvider
 from app.services.llm.factory import get_llm_provider, get_embedding_provider
+from app.services.semantic_cache import SemanticCache
 
 logger = get_logger(__name__)
 
+# Words ignored by the keyword (ILIKE) fallback search.
+KEYWORD_STOP_WORDS = frozenset({
+    'ce', 'sunt', 'este', 'cum', 'care', 'din', 'la', 'în', 'și', 'sau',
+    'pentru', 'cu', 'despre', 'pe', 'de', 'a', 'ai', 'am', 'ma', 'mi',
+    'le', 'îmi', 'îți', 'și-a', 'dat', 'dau', 'da', 'spune', 'spune-mi',
+    'decizii', 'decizie', 'cnsc', 'avem', 'baza', 'date',
+})
+
+# Full-text matches fetched before ranking; ts_rank_cd only scores these,
+# so a common keyword does not make Postgres rank every matching decision.
+# Candidates are the newest matches (ties broken by id), so results are
+# stable between runs; older decisions past the cap are not ranked.
+FTS_CANDIDATE_LIMIT = 500
+
+# Word tokens; inner '.', '/' and '-' are kept so references such as
+# "art.57", "2345/C3/2024" or "spune-mi" survive as a single token.
+_KEYWORD_TOKEN_RE = re.compile(r"\w+(?:[./-]\w+)*")
+
+# A context block cut by the token budget is only kept if at least this
+# much of it fits (smaller fragments add tokens without usable content).
+MIN_PACKED_CONTEXT_CHARS = 2000
+
+# Static follow-up suggestions shown under chat answers.
+SUGGESTION_ADMIS = "Care sunt argumentele care au dus la admiterea contestației?"
+SUGGESTION_RESPINS = "De ce au fost respinse aceste contestații?"
+SUGGESTION_SIMILAR = "Arată-mi decizii similare"
+SUGGESTIONS_NO_RESULTS = ("Ce decizii CNSC sunt disponibile?", "Arată-mi toate deciziile")
+
+
+def _decision_header(dec: DecizieCNSC) -> str:
+    """Metadata block that opens every decision in the LLM context."""
+    cpv_info = dec.cod_cpv or 'N/A'
+    if dec.cpv_descriere:
+        cpv_info += f" — {dec.cpv_descriere}"
+    if dec.cpv_categorie:
+        cpv_info += f" ({dec.cpv_categorie})"
+
+    return "\n".join([
+        f"=== Decizia {dec.external_id} ===",
+        f"Număr decizie: {dec.numar_decizie or 'N/A'}",
+        f"Dată: {dec.data_decizie.strftime('%d.%m.%Y') if dec.data_decizie else 'N/A'}",
+        f"Complet: {dec.complet or 'N/A'}",
+        f"Tip contestație: {dec.tip_contestatie}",
+        f"Coduri critici: {', '.join(dec.coduri_critici) if dec.coduri_critici else 'N/A'}",
+        f"CPV: {cpv_info}",
+        f"Soluție: {dec.solutie_contestatie or 'N/A'}",
+        f"Contestator: {dec.contestator or 'N/A'}",
+        f"Autoritate contractantă: {dec.autoritate_contractanta or 'N/A'}",
+    ])
+
 
 class Citation(BaseModel):
     """A citation from a CNSC decision."""
@@ -52,6 +107,7 @@ class RAGService:
         """
         self.llm = llm_provider or get_llm_provider()
         self.embedding_service = EmbeddingService(llm_provider=get_embedding_provider())
+        self.semantic_cache = SemanticCache()
 
     async def search_by_vector(
         self,
@@ -267,7 +323,11 @@ class RAGService:
             for year, num in bo_refs
         ]
 
-        stmt = select(DecizieCNSC).where(or_(*conditions))
+        stmt = (
+            select(DecizieCNSC)
+            .options(defer(DecizieCNSC.text_integral))
+            .where(or_(*conditions))
+        )
         result = await session.execute(stmt)
         decisions = list(result.scalars().all())
 
@@ -665,6 +725,7 @@ class RAGService:
 
         stmt = (
             select(DecizieCNSC)
+            .options(defer(DecizieCNSC.text_integral))
             .where(or_(*conditions))
             .order_by(DecizieCNSC.data_decizie.desc().nulls_last())
             .limit(limit)
@@ -952,11 +1013,14 @@ class RAGService:
         seen_prefixes: set[str] = set()
         for row in rows:
             cod = row[0]
-            prefix = cod.split("-")[0] if cod else cod
-            is_child = any(prefix.startswith(sp) for sp in seen_prefixes)
+            prefix = cod.split("-")[0] if cod else ""
+            # A code is a child if any of its leading substrings (at most 8
+            # digits) was already kept — set lookups instead of scanning
+            # every kept prefix.
+            is_child = any(prefix[:k] in seen_prefixes for k in range(len(prefix) + 1))
             if not is_child:
                 cpv_codes.append(cod)
-                seen_prefixes.add(prefix.rstrip("0") if prefix else "")
+                seen_prefixes.add(prefix.rstrip("0"))
         return cpv_codes
 
     async def _search_by_cpv_domain(
@@ -982,6 +1046,7 @@ class RAGService:
         cpv_conditions = [DecizieCNSC.cod_cpv.ilike(f"{cpv}%") for cpv in cpv_codes]
         stmt = (
             select(DecizieCNSC)
+            .options(defer(DecizieCNSC.text_integral))
             .where(or_(*cpv_conditions))
             .order_by(DecizieCNSC.data_decizie.desc().nulls_last())
             .limit(limit)
@@ -1166,7 +1231,6 @@ class RAGService:
             Tuple of (decisions, matched_chunks). matched_chunks is a list of
             (ArgumentareCritica, distance) tuples; empty if using fallback.
         """
-        import time
         t0 = time.monotonic()
 
         logger.info("searching_decisions", query=query, max_chunks=max_chunks,
@@ -1212,14 +1276,19 @@ class RAGService:
         if enable_expansion:
             queries = await self._expand_query(query)
 
-        # Vector search for each query variant
+        # Vector search for each query variant. Variant embeddings go out as
+        # one batched API call; the HNSW searches share the session and stay
+        # sequential.
         t_vec_start = time.monotonic()
+        query_vectors = [query_vector]
+        if len(queries) > 1:
+            query_vectors += await self.embedding_service.embed_queries(queries[1:])
         matched_chunks: list[tuple[ArgumentareCritica, float]] = []
-        for i, q in enumerate(queries):
+        for q, q_vector in zip(queries, query_vectors):
             v_results = await self.search_by_vector(
                 q, session, limit=max_chunks,
                 scope_decision_ids=scope_decision_ids,
-                query_vector=query_vector if i == 0 else None,
+                query_vector=q_vector,
             )
             matched_chunks.extend(v_results)
         t_vec = time.monotonic()
@@ -1262,7 +1331,6 @@ class RAGService:
 
             # Load parent decisions WITHOUT text_integral (metadata only)
             t_load_start = time.monotonic()
-            from sqlalchemy.orm import defer
             stmt = (
                 select(DecizieCNSC)
                 .options(defer(DecizieCNSC.text_integral))
@@ -1321,9 +1389,46 @@ class RAGService:
         limit: int,
         scope_decision_ids: list[str] | None = None,
     ) -> list[DecizieCNSC]:
-        """Fallback keyword search using ILIKE."""
+        """Fallback keyword search: ranked full-text hits, topped up by ILIKE.
+
+        The full-text pass matches any keyword against ``search_vec``
+        (text, contestator, autoritate). At most ``FTS_CANDIDATE_LIMIT``
+        matches, newest first, are taken before ``ts_rank_cd`` orders them. If that leaves
+        room under ``limit``, the ILIKE pass adds partial-word, filename and
+        CPV-description matches; every column it searches has a pg_trgm GIN
+        index, so the OR of leading-wildcard ILIKEs is served by a BitmapOr
+        of index scans.
+        """
         keywords = self._extract_keywords(query)
 
+        decisions: list[DecizieCNSC] = []
+        if keywords:
+            tsquery = func.websearch_to_tsquery("simple", " or ".join(keywords))
+            candidates = (
+                select(DecizieCNSC.id)
+                .where(DecizieCNSC.search_vec.op("@@")(tsquery))
+                .order_by(DecizieCNSC.data_decizie.desc().nulls_last(), DecizieCNSC.id)
+                .limit(FTS_CANDIDATE_LIMIT)
+            )
+            if scope_decision_ids is not None:
+                candidates = candidates.where(DecizieCNSC.id.in_(scope_decision_ids))
+            stmt = (
+                select(DecizieCNSC)
+                .options(defer(DecizieCNSC.text_integral))
+                .where(DecizieCNSC.id.in_(candidates.scalar_subquery()))
+                .order_by(
+                    func.ts_rank_cd(DecizieCNSC.search_vec, tsquery).desc(),
+                    DecizieCNSC.data_decizie.desc().nulls_last(),
+                )
+                .limit(limit)
+            )
+
+            result = await session.execute(stmt)
+            decisions = list(result.scalars().all())
+            logger.info("fts_search_decisions_found", count=len(decisions))
+            if len(decisions) >= limit:
+                return decisions
+
         conditions = []
         for keyword in keywords:
             keyword_pattern = f"%{keyword}%"
@@ -1334,47 +1439,32 @@ class RAGService:
             conditions.append(DecizieCNSC.cpv_descriere.ilike(keyword_pattern))
             conditions.append(DecizieCNSC.cpv_clasa.ilike(keyword_pattern))
 
-        from sqlalchemy.orm import defer
-        if not conditions:
-            stmt = (
-                select(DecizieCNSC)
-                .options(defer(DecizieCNSC.text_integral))
-                .order_by(DecizieCNSC.data_decizie.desc().nulls_last())
-                .limit(limit)
-            )
-        else:
-            stmt = (
-                select(DecizieCNSC)
-                .options(defer(DecizieCNSC.text_integral))
-                .where(or_(*conditions))
-                .order_by(DecizieCNSC.data_decizie.desc().nulls_last())
-                .limit(limit)
-            )
+        stmt = (
+            select(DecizieCNSC)
+            .options(defer(DecizieCNSC.text_integral))
+            .order_by(DecizieCNSC.data_decizie.desc().nulls_last())
+            .limit(limit - len(decisions))
+        )
+        if conditions:
+            stmt = stmt.where(or_(*conditions))
+        if decisions:
+            stmt = stmt.where(DecizieCNSC.id.not_in([d.id for d in decisions]))
 
         # Scope pre-filter
         if scope_decision_ids is not None:
             stmt = stmt.where(DecizieCNSC.id.in_(scope_decision_ids))
 
         result = await session.execute(stmt)
-        decisions = list(result.scalars().all())
+        extra = list(result.scalars().all())
 
-        logger.info("keyword_search_decisions_found", count=len(decisions))
-        return decisions
+        logger.info("keyword_search_decisions_found", count=len(extra))
+        return decisions + extra
 
     def _extract_keywords(self, query: str) -> list[str]:
         """Extract meaningful keywords from query."""
-        stop_words = {
-            'ce', 'sunt', 'este', 'cum', 'care', 'din', 'la', 'în', 'și', 'sau',
-            'pentru', 'cu', 'despre', 'pe', 'de', 'a', 'ai', 'am', 'ma', 'mi',
-            'le', 'îmi', 'îți', 'și-a', 'dat', 'dau', 'da', 'spune', 'spune-mi',
-            'decizii', 'decizie', 'cnsc', 'avem', 'baza', 'date'
-        }
-
-        words = query.lower().split()
         keywords = [
-            word.strip('.,?!;:')
-            for word in words
-            if len(word) >= 3 and word.lower() not in stop_words
+            word for word in _KEYWORD_TOKEN_RE.findall(query.lower())
+            if len(word) >= 3 and word not in KEYWORD_STOP_WORDS
         ]
 
         logger.debug("extracted_keywords", keywords=keywords)
@@ -1455,9 +1545,9 @@ class RAGService:
         """Build context strings from decisions and matched chunks for LLM.
 
         When vector search was used, builds rich context from the matched
-        ArgumentareCritica chunks (structured analysis) plus verbatim excerpts
-        from text_integral for direct quoting. Falls back to truncated
-        text_integral when no chunks are available.
+        ArgumentareCritica chunks (structured analysis). Falls back to the
+        decision metadata header alone when no chunks are available;
+        text_integral is never needed here (and is deferred by the searches).
         """
         contexts = []
 
@@ -1473,57 +1563,41 @@ class RAGService:
                 if not dec:
                     continue
 
-                cpv_info = dec.cod_cpv or 'N/A'
-                if dec.cpv_descriere:
-                    cpv_info += f" — {dec.cpv_descriere}"
-                if dec.cpv_categorie:
-                    cpv_info += f" ({dec.cpv_categorie})"
-
                 context_parts = [
-                    f"=== Decizia {dec.external_id} ===",
-                    f"Număr decizie: {dec.numar_decizie or 'N/A'}",
-                    f"Dată: {dec.data_decizie.strftime('%d.%m.%Y') if dec.data_decizie else 'N/A'}",
-                    f"Complet: {dec.complet or 'N/A'}",
-                    f"Tip contestație: {dec.tip_contestatie}",
-                    f"Coduri critici: {', '.join(dec.coduri_critici) if dec.coduri_critici else 'N/A'}",
-                    f"CPV: {cpv_info}",
-                    f"Soluție: {dec.solutie_contestatie or 'N/A'}",
-                    f"Contestator: {dec.contestator or 'N/A'}",
-                    f"Autoritate contractantă: {dec.autoritate_contractanta or 'N/A'}",
+                    _decision_header(dec),
                     "",
                     "## Analiză structurată per critică:",
                     "",
                 ]
 
+                add = context_parts.append
                 for arg, dist in chunks:
-                    similarity = 1.0 - dist
-                    context_parts.append(
-                        f"--- Critica {arg.cod_critica} (relevanță: {similarity:.2f}) ---"
-                    )
+                    add(f"--- Critica {arg.cod_critica} (relevanță: {1.0 - dist:.2f}) ---")
                     if arg.argumente_contestator:
-                        context_parts.append(f"Argumente contestator: {arg.argumente_contestator}")
+                        add(f"Argumente contestator: {arg.argumente_contestator}")
                     if arg.jurisprudenta_contestator:
-                        context_parts.append(f"Jurisprudență invocată de contestator: {'; '.join(arg.jurisprudenta_contestator)}")
+                        add(f"Jurisprudență invocată de contestator: {'; '.join(arg.jurisprudenta_contestator)}")
                     if arg.argumente_ac:
-                        context_parts.append(f"Argumente AC: {arg.argumente_ac}")
+                        add(f"Argumente AC: {arg.argumente_ac}")
                     if arg.jurisprudenta_ac:
-                        context_parts.append(f"Jurisprudență invocată de AC: {'; '.join(arg.jurisprudenta_ac)}")
+                        add(f"Jurisprudență invocată de AC: {'; '.join(arg.jurisprudenta_ac)}")
                     if arg.argumente_intervenienti:
                         for interv in arg.argumente_intervenienti:
                             nr = interv.get("nr", "?")
-                            context_parts.append(f"Argumente intervenient #{nr}: {interv.get('argumente', 'N/A')}")
+                            add(f"Argumente intervenient #{nr}: {interv.get('argumente', 'N/A')}")
                             jp = interv.get("jurisprudenta", [])
                             if jp:
-                                context_parts.append(f"Jurisprudență intervenient #{nr}: {'; '.join(jp)}")
+                                add(f"Jurisprudență intervenient #{nr}: {'; '.join(jp)}")
                     if arg.elemente_retinute_cnsc:
-                        context_parts.append(f"Elemente reținute CNSC: {arg.elemente_retinute_cnsc}")
+                        add(f"Elemente reținute CNSC: {arg.elemente_retinute_cnsc}")
                     if arg.argumentatie_cnsc:
-                        context_parts.append(f"Argumentație CNSC: {arg.argumentatie_cnsc}")
+                        add(f"Argumentație CNSC: {arg.argumentatie_cnsc}")
                     if arg.jurisprudenta_cnsc:
-                        context_parts.append(f"Jurisprudență invocată de CNSC: {'; '.join(arg.jurisprudenta_cnsc)}")
-                    if arg.castigator_critica and arg.castigator_critica != "unknown":
-                        context_parts.append(f"Câștigător: {arg.castigator_critica}")
-                    context_parts.append("")
+                        add(f"Jurisprudență invocată de CNSC: {'; '.join(arg.jurisprudenta_cnsc)}")
+                    castigator = arg.castigator_critica
+                    if castigator and castigator != "unknown":
+                        add(f"Câștigător: {castigator}")
+                    add("")
 
                 # Sintezele LLM din ArgumentareCritica conțin toată informația
                 # relevantă — text_integral nu mai este necesar (conține garbage)
@@ -1532,25 +1606,7 @@ class RAGService:
         else:
             # Fallback: keyword search found decisions but no ArgumentareCritica chunks
             # Show only metadata (text_integral not loaded for performance)
-            for dec in decisions:
-                cpv_info = dec.cod_cpv or 'N/A'
-                if dec.cpv_descriere:
-                    cpv_info += f" — {dec.cpv_descriere}"
-                if dec.cpv_categorie:
-                    cpv_info += f" ({dec.cpv_categorie})"
-                context_parts = [
-                    f"=== Decizia {dec.external_id} ===",
-                    f"Număr decizie: {dec.numar_decizie or 'N/A'}",
-                    f"Dată: {dec.data_decizie.strftime('%d.%m.%Y') if dec.data_decizie else 'N/A'}",
-                    f"Complet: {dec.complet or 'N/A'}",
-                    f"Tip contestație: {dec.tip_contestatie}",
-                    f"Coduri critici: {', '.join(dec.coduri_critici) if dec.coduri_critici else 'N/A'}",
-                    f"CPV: {cpv_info}",
-                    f"Soluție: {dec.solutie_contestatie or 'N/A'}",
-                    f"Contestator: {dec.contestator or 'N/A'}",
-                    f"Autoritate contractantă: {dec.autoritate_contractanta or 'N/A'}",
-                ]
-                contexts.append("\n".join(context_parts))
+            contexts = [_decision_header(dec) for dec in decisions]
 
         return contexts
 
@@ -1561,9 +1617,10 @@ class RAGService:
     ) -> list[Citation]:
         """Build citations from ALL matched decisions, ordered by relevance.
 
-        Order follows vector search distance (first = most relevant).
-        Includes every decision that has matched chunks, not just those
-        mentioned in the LLM response.
+        Order follows vector search distance (first = most relevant), one
+        citation per decision block built by ``_build_context``. Includes
+        every decision that has matched chunks, not just those mentioned in
+        the LLM response.
         """
         citations = []
         decision_map = {d.id: d for d in decisions}
@@ -1623,26 +1680,20 @@ class RAGService:
         """Generate contextual follow-up questions based on decisions found."""
         suggestions = []
 
-        all_critici = set()
-        solutions = set()
-
-        for dec in decisions:
-            if dec.coduri_critici:
-                all_critici.update(dec.coduri_critici)
-            if dec.solutie_contestatie:
-                solutions.add(dec.solutie_contestatie)
+        all_critici = {c for dec in decisions if dec.coduri_critici for c in dec.coduri_critici}
+        solutions = {dec.solutie_contestatie for dec in decisions if dec.solutie_contestatie}
 
         if all_critici:
-            critica_list = ', '.join(sorted(all_critici)[:3])
+            critica_list = ', '.join(heapq.nsmallest(3, all_critici))
             suggestions.append(f"Ce jurisprudență există pentru criticile {critica_list}?")
 
         if 'ADMIS' in solutions or 'ADMIS_PARTIAL' in solutions:
-            suggestions.append("Care sunt argumentele care au dus la admiterea contestației?")
+            suggestions.append(SUGGESTION_ADMIS)
 
         if 'RESPINS' in solutions:
-            suggestions.append("De ce au fost respinse aceste contestații?")
+            suggestions.append(SUGGESTION_RESPINS)
 
-        suggestions.append("Arată-mi decizii similare")
+        suggestions.append(SUGGESTION_SIMILAR)
 
         return suggestions[:4]
 
@@ -1670,7 +1721,6 @@ class RAGService:
             Tuple of (relevant_chunks: list[(ArgumentareCritica, distance)],
                        legislation_fragments: list[(LegislatieFragment, act_name)])
         """
-        import time
         t0 = time.monotonic()
 
         # 1. Concatenate all documents into one text
@@ -1815,7 +1865,6 @@ class RAGService:
         Converts multi_chunk_search output into the same format as prepare_context:
         (contexts, system_prompt, citations, confidence).
         """
-        from sqlalchemy.orm import defer
 
         if not relevant_chunks and not legislation_fragments:
             return None, None, [], 0.0
@@ -1855,6 +1904,21 @@ class RAGService:
 
         return contexts, system_prompt, citations, confidence
 
+    async def _embed_search_query(self, query: str) -> list[float]:
+        """Embed a user query for retrieval, truncating very long inputs."""
+        # Truncate query for embedding: embedding models have token limits and
+        # very long inputs (e.g., 100K-char memo topics) produce poor vectors.
+        # Keep first ~4000 chars (~1000 tokens) which captures the semantic intent.
+        MAX_EMBED_QUERY_CHARS = 4000
+        embed_query = query[:MAX_EMBED_QUERY_CHARS] if len(query) > MAX_EMBED_QUERY_CHARS else query
+        if len(query) > MAX_EMBED_QUERY_CHARS:
+            logger.info(
+                "query_truncated_for_embedding",
+                original_len=len(query),
+                truncated_len=len(embed_query),
+            )
+        return await self.embedding_service.embed_query(embed_query)
+
     async def prepare_context(
         self,
         query: str,
@@ -1864,6 +1928,7 @@ class RAGService:
         scope_decision_ids: list[str] | None = None,
         enable_expansion: bool = False,
         enable_rerank: bool = False,
+        query_vector: list[float] | None = None,
     ) -> tuple[list[str], str, list[Citation], float, list[str]]:
         """Prepare RAG context without generating the LLM response.
 
@@ -1872,28 +1937,17 @@ class RAGService:
             enable_expansion: If True, use LLM query expansion for better retrieval.
                 Default False for performance.
             enable_rerank: If True, use LLM reranking of retrieved chunks.
+            query_vector: Pre-computed query embedding (skips embedding call).
 
         Returns:
             Tuple of (contexts, system_prompt, citations, confidence, suggested_questions).
             Returns None for contexts/system_prompt if no results found.
         """
-        import time
         t0 = time.monotonic()
 
-        # Truncate query for embedding: embedding models have token limits and
-        # very long inputs (e.g., 100K-char memo topics) produce poor vectors.
-        # Keep first ~4000 chars (~1000 tokens) which captures the semantic intent.
-        MAX_EMBED_QUERY_CHARS = 4000
-        embed_query = query[:MAX_EMBED_QUERY_CHARS] if len(query) > MAX_EMBED_QUERY_CHARS else query
-        if len(query) > MAX_EMBED_QUERY_CHARS:
-            logger.info(
-                "query_truncated_for_embedding",
-                original_len=len(query),
-                truncated_len=len(embed_query),
-            )
-
         # EMBED QUERY ONCE — reuse the vector in all sub-functions
-        query_vector = await self.embedding_service.embed_query(embed_query)
+        if query_vector is None:
+            query_vector = await self._embed_search_query(query)
         t_embed = time.monotonic()
         logger.info("timing_embed_query", duration_s=round(t_embed - t0, 2))
 
@@ -1937,22 +1991,31 @@ class RAGService:
                      decisions_s=round(t_decisions - t_spete, 2))
 
         if not decisions and not legislation_fragments and not spete_anap:
-            return None, None, [], 0.0, ["Ce decizii CNSC sunt disponibile?", "Arată-mi toate deciziile"]
+            return None, None, [], 0.0, list(SUGGESTIONS_NO_RESULTS)
 
         contexts = []
         if legislation_fragments:
             contexts.extend(self._build_legislation_context(legislation_fragments))
+        spete_start = len(contexts)
         if spete_anap:
             contexts.extend(self._build_spete_context(spete_anap))
+        decisions_start = len(contexts)
         if decisions:
             contexts.extend(self._build_context(decisions, matched_chunks))
+        contexts = self._pack_contexts(contexts, get_settings().rag_context_budget_tokens)
+
+        # Cite only what the LLM was shown: blocks dropped by the budget are
+        # the tail, and decision citations follow the same per-decision order
+        # as the decision context blocks.
+        kept_spete = max(0, min(len(contexts), decisions_start) - spete_start)
+        kept_decisions = max(0, len(contexts) - decisions_start)
 
         system_prompt = self._build_system_prompt(
             bool(legislation_fragments), bool(decisions), bool(spete_anap)
         )
-        citations = self._build_citations(decisions, matched_chunks)
+        citations = self._build_citations(decisions, matched_chunks)[:kept_decisions]
         if spete_anap:
-            citations.extend(self._build_spete_citations(spete_anap))
+            citations.extend(self._build_spete_citations(spete_anap[:kept_spete]))
         confidence = self._calculate_confidence(decisions, matched_chunks, max_decisions)
         if legislation_fragments and not decisions:
             confidence = max(confidence, 0.9)
@@ -1966,6 +2029,42 @@ class RAGService:
 
         return contexts, system_prompt, citations, confidence, suggested
 
+    @staticmethod
+    def _pack_contexts(contexts: list[str], budget_tokens: int) -> list[str]:
+        """Keep context blocks, in relevance order, until the token budget is spent.
+
+        Blocks arrive most-relevant first (legislation, spețe, then decisions
+        by vector distance), so the tail is what gets dropped. The block that
+        crosses the budget is cut at a line boundary if a useful part of it
+        still fits. Tokens are estimated at ~4 chars each, like the providers do.
+        """
+        budget_chars = budget_tokens * 4
+        total_chars = sum(len(c) for c in contexts)
+        if total_chars <= budget_chars:
+            return contexts
+
+        packed = []
+        used = 0
+        for ctx in contexts:
+            remaining = budget_chars - used
+            if len(ctx) <= remaining:
+                packed.append(ctx)
+                used += len(ctx)
+                continue
+            if remaining >= MIN_PACKED_CONTEXT_CHARS:
+                cut = ctx.rfind("\n", 0, remaining)
+                packed.append(ctx[:cut if cut > 0 else remaining])
+            break
+
+        logger.info(
+            "rag_context_packed",
+            original_chars=total_chars,
+            packed_chars=sum(len(c) for c in packed),
+            blocks_kept=len(packed),
+            blocks_total=len(contexts),
+        )
+        return packed
+
     def _build_system_prompt(
         self, has_legislation: bool, has_decisions: bool, has_spete: bool = False,
     ) -> str:
@@ -2057,11 +2156,36 @@ Răspunde în limba română, profesional și precis."""
         logger.info("generating_rag_response", query=query,
                      scoped=scope_decision_ids is not None)
 
+        # Semantic cache: only stand-alone questions are cacheable — with
+        # history the same words can mean something different.
+        query_vector = None
+        cache_key = None
+        if self.semantic_cache.enabled and not conversation_history:
+            query_vector = await self._embed_search_query(query)
+            cache_key = self.semantic_cache.params_key(
+                provider=self.llm.provider_name,
+                model=self.llm.model_name,
+                max_decisions=max_decisions,
+                scope=sorted(scope_decision_ids) if scope_decision_ids is not None else None,
+                rerank=enable_rerank,
+                expansion=enable_expansion,
+                extra=extra_system_context,
+            )
+            cached = await self.semantic_cache.lookup(session, query_vector, cache_key)
+            if cached is not None:
+                return (
+                    cached["response"],
+                    [Citation(**c) for c in cached["citations"]],
+                    cached["confidence"],
+                    cached["suggested_questions"],
+                )
+
         contexts, system_prompt, citations, confidence, suggested_questions = await self.prepare_context(
             query, session, conversation_history, max_decisions,
             scope_decision_ids=scope_decision_ids,
             enable_rerank=enable_rerank,
             enable_expansion=enable_expansion,
+            query_vector=query_vector,
         )
 
         if contexts is None:
@@ -2092,6 +2216,14 @@ Răspunde în limba română, profesional și precis."""
                 confidence=confidence,
             )
 
+            if cache_key is not None:
+                await self.semantic_cache.store(query, query_vector, cache_key, {
+                    "response": response_text,
+                    "citations": [c.model_dump() for c in citations],
+                    "confidence": confidence,
+                    "suggested_questions": suggested_questions,
+                })
+
             return response_text, citations, confidence, suggested_questions
 
         except Exception as e:
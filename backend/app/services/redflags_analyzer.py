@@ -17,9 +17,11 @@ Pass 2 — Grounding per Red Flag:
 import asyncio
 import json
 import re
+import time
 from typing import Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from app.core.logging import get_logger
 from app.models.decision import ArgumentareCritica, LegislatieFragment, ActNormativ, DecizieCNSC
@@ -29,7 +31,7 @@ from app.services.llm.factory import get_llm_provider, get_embedding_provider
 
 logger = get_logger(__name__)
 
-# Max concurrent grounding tasks (avoid overwhelming the API)
+# Max concurrent LLM calls per fan-out (avoid overwhelming the API)
 MAX_CONCURRENT_GROUNDING = 8
 
 # Document chunking thresholds
@@ -196,6 +198,7 @@ Severitate:
                     system_prompt=system_prompt,
                     temperature=0.1,
                     max_tokens=8192,
+                    json_mode=True,
                 ),
                 timeout=LLM_CALL_TIMEOUT,
             )
@@ -284,10 +287,13 @@ Severitate:
 
         # Large document — parallel chunk analysis
         logger.info("large_document_parallel_detection", num_chunks=len(chunks))
-        tasks = [
-            self._detect_single_chunk(chunk, idx, len(chunks))
-            for idx, chunk in enumerate(chunks)
-        ]
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_GROUNDING)
+
+        async def detect_with_limit(chunk: str, idx: int) -> list[dict]:
+            async with semaphore:
+                return await self._detect_single_chunk(chunk, idx, len(chunks))
+
+        tasks = [detect_with_limit(chunk, idx) for idx, chunk in enumerate(chunks)]
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -459,7 +465,6 @@ Severitate:
             return [], []
 
         # Load parent decisions (defer text_integral — not needed, saves ~39KB/decision)
-        from sqlalchemy.orm import defer
         dec_ids = list({arg.decizie_id for arg, _ in relevant_chunks})
         stmt = select(DecizieCNSC).options(defer(DecizieCNSC.text_integral)).where(DecizieCNSC.id.in_(dec_ids))
         result = await session.execute(stmt)
@@ -476,10 +481,29 @@ Severitate:
 
         return decisions, relevant_chunks
 
+    @staticmethod
+    def _search_query_for(clause_info: dict) -> str:
+        return clause_info.get("search_query", clause_info.get("issue", ""))
+
+    async def _embed_flag_queries(self, clauses: list[dict]) -> list[Optional[list[float]]]:
+        """Embed the search queries of all flags in one batched API call.
+
+        If the batch fails every entry comes back as None and each flag is
+        retried (and logged) individually by ``_fetch_context_for_flag``.
+        """
+        try:
+            return await self.embedding_service.embed_queries(
+                [self._search_query_for(c) for c in clauses]
+            )
+        except Exception as e:
+            logger.warning("flag_query_batch_embed_failed", error=str(e))
+            return [None] * len(clauses)
+
     async def _fetch_context_for_flag(
         self,
         clause_info: dict,
         session: AsyncSession,
+        query_vector: Optional[list[float]] = None,
     ) -> dict:
         """Fetch DB context (legislation + jurisprudence) for a single flag.
 
@@ -489,24 +513,27 @@ Severitate:
         Args:
             clause_info: Dict from Pass 1 with clause, issue, search_query.
             session: Database session.
+            query_vector: Pre-computed embedding of the search query. When
+                omitted the query is embedded here.
 
         Returns:
             Dict with legal_articles, decisions, matched_chunks.
         """
-        search_query = clause_info.get("search_query", clause_info.get("issue", ""))
+        search_query = self._search_query_for(clause_info)
 
         # Embed ONCE, reuse for both searches (avoids 2x Gemini API calls per flag)
-        try:
-            query_vector = await self.embedding_service.embed_query(search_query)
-        except Exception as e:
-            logger.error(
-                "embed_query_error",
-                search_query_preview=search_query[:80],
-                error=str(e),
-                error_type=type(e).__name__,
-                exc_info=True,
-            )
-            return {"legal_articles": [], "decisions": [], "matched_chunks": []}
+        if query_vector is None:
+            try:
+                query_vector = await self.embedding_service.embed_query(search_query)
+            except Exception as e:
+                logger.error(
+                    "embed_query_error",
+                    search_query_preview=search_query[:80],
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    exc_info=True,
+                )
+                return {"legal_articles": [], "decisions": [], "matched_chunks": []}
 
         # Run searches SEQUENTIALLY — AsyncSession cannot handle concurrent queries
         try:
@@ -686,6 +713,7 @@ IMPORTANT pentru clarification_proposal:
                     system_prompt=system_prompt,
                     temperature=0.1,
                     max_tokens=4096,
+                    json_mode=True,
                 ),
                 timeout=LLM_CALL_TIMEOUT,
             )
@@ -821,7 +849,6 @@ IMPORTANT pentru clarification_proposal:
         Returns:
             List of grounded red flags.
         """
-        import time
         t0 = time.monotonic()
 
         logger.info(
@@ -856,12 +883,14 @@ IMPORTANT pentru clarification_proposal:
 
         # Pass 2: Grounding per flag (two phases to avoid concurrent session use)
         if use_jurisprudence and session:
-            # Phase 2a: Fetch all DB context SEQUENTIALLY (AsyncSession is not
-            # safe for concurrent use from multiple coroutines)
+            # Phase 2a: Embed all search queries in ONE batch, then fetch DB
+            # context SEQUENTIALLY (AsyncSession is not safe for concurrent
+            # use from multiple coroutines)
             logger.info("pass2_fetching_context", count=len(detected_clauses))
+            query_vectors = await self._embed_flag_queries(detected_clauses)
             contexts = []
-            for clause in detected_clauses:
-                ctx = await self._fetch_context_for_flag(clause, session)
+            for clause, query_vector in zip(detected_clauses, query_vectors):
+                ctx = await self._fetch_context_for_flag(clause, session, query_vector=query_vector)
                 contexts.append(ctx)
 
             t_context = time.monotonic()
@@ -0,0 +1,108 @@
+"""Semantic response cache for the RAG chat.
+
+Stores generated answers together with the embedding of the question that
+produced them. A new question whose embedding is close enough (cosine
+similarity >= threshold) to a cached one, asked with the same retrieval
+parameters and model, reuses the stored answer — skipping retrieval and
+the LLM call entirely.
+
+The cache is best-effort: any database error is logged and treated as a
+miss, so chat keeps working if the table is missing or unavailable.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.db import session as db_session
+from app.models.decision import RAGResponseCache
+
+logger = get_logger(__name__)
+
+
+class SemanticCache:
+    """pgvector-backed cache of RAG answers keyed on query embeddings."""
+
+    def __init__(
+        self,
+        threshold: Optional[float] = None,
+        ttl_hours: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        settings = get_settings()
+        self.threshold = threshold if threshold is not None else settings.rag_semantic_cache_threshold
+        self.ttl_hours = ttl_hours if ttl_hours is not None else settings.rag_semantic_cache_ttl_hours
+        self.enabled = enabled if enabled is not None else settings.rag_semantic_cache_enabled
+
+    @staticmethod
+    def params_key(**params) -> str:
+        """Hash the parameters that influence the answer besides the query."""
+        raw = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    async def lookup(
+        self,
+        session: AsyncSession,
+        query_vector: list[float],
+        params_key: str,
+    ) -> Optional[dict]:
+        """Return the cached payload for the nearest similar query, if any."""
+        if not self.enabled:
+            return None
+
+        cutoff = datetime.utcnow() - timedelta(hours=self.ttl_hours)
+        distance = RAGResponseCache.embedding.cosine_distance(query_vector)
+        stmt = (
+            select(RAGResponseCache.payload, RAGResponseCache.query_text, distance.label("distance"))
+            .where(RAGResponseCache.params_hash == params_key)
+            .where(RAGResponseCache.created_at >= cutoff)
+            .order_by(distance)
+            .limit(1)
+        )
+
+        try:
+            # Savepoint: a failed lookup must not abort the caller's transaction.
+            async with session.begin_nested():
+                row = (await session.execute(stmt)).first()
+        except Exception as e:
+            logger.warning("semantic_cache_lookup_failed", error=str(e))
+            return None
+
+        if row is None or row.distance > 1.0 - self.threshold:
+            return None
+
+        logger.info(
+            "semantic_cache_hit",
+            similarity=round(1.0 - row.distance, 4),
+            cached_query=row.query_text[:80],
+        )
+        return row.payload
+
+    async def store(
+        self,
+        query: str,
+        query_vector: list[float],
+        params_key: str,
+        payload: dict,
+    ) -> None:
+        """Persist an answer in its own session so the caller's transaction is untouched."""
+        if not self.enabled or db_session.async_session_factory is None:
+            return
+
+        try:
+            async with db_session.async_session_factory() as session:
+                session.add(RAGResponseCache(
+                    params_hash=params_key,
+                    query_text=query,
+                    embedding=query_vector,
+                    payload=payload,
+                ))
+                await session.commit()
+        except Exception as e:
+            logger.warning("semantic_cache_store_failed", error=str(e))
@@ -2,6 +2,14 @@
 
 import pytest
 
+from app.services.parser import CNSCDecisionParser
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """Shared parser instance (stateless; patterns are compiled at import)."""
+    return CNSCDecisionParser()
+
 
 @pytest.fixture
 def sample_filename_with_cpv():
@@ -21,7 +29,7 @@ def sample_filename_no_cpv():
     return "BO2024_5678_R3_R4_X.txt"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_decision_text_admis():
     """Sample CNSC decision text with ADMIS ruling."""
     return """
@@ -54,7 +62,7 @@ def sample_decision_text_admis():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_decision_text_respins():
     """Sample CNSC decision text with RESPINS ruling."""
     return """
@@ -135,3 +143,21 @@ def sample_decision_text_with_sections():
 
     Respinge, ca nefondată, contestația.
     """
+
+
+@pytest.fixture(scope="session")
+def parsed_admis(parser, sample_decision_text_admis):
+    """The ADMIS sample parsed once per session (treat as read-only)."""
+    return parser.parse_text(
+        sample_decision_text_admis,
+        source_file="BO2025_3855_R2_CPV_55520000-1_A.txt"
+    )
+
+
+@pytest.fixture(scope="session")
+def parsed_respins(parser, sample_decision_text_respins):
+    """The RESPINS sample parsed once per session (treat as read-only)."""
+    return parser.parse_text(
+        sample_decision_text_respins,
+        source_file="BO2025_1234_D1_D4_CPV_45233140-2_R.txt"
+    )
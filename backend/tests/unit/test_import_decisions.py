@@ -0,0 +1,227 @@
+"""Tests for the GCS decision importer script.
+
+The GCS bucket and the database session are replaced by small in-memory
+stand-ins; only the importer's own filtering, caching and row building
+is exercised.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import structlog
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+
+import import_decisions_from_gcs as importer_module  # noqa: E402
+from import_decisions_from_gcs import (  # noqa: E402
+    DecisionImporter,
+    _basename,
+    _configure_log_level,
+)
+
+
+VALID_BLOB = "decizii-cnsc/BO2025_3855_R2_CPV_55520000-1_A.txt"
+INVALID_BLOB = "decizii-cnsc/notes.txt"
+
+
+class FakeBlob:
+    def __init__(self, name, content=b"", md5_hash=None):
+        self.name = name
+        self.content = content
+        self.md5_hash = md5_hash
+        self.downloads = 0
+
+    def download_as_bytes(self, timeout=None):
+        self.downloads += 1
+        return self.content
+
+
+class FakeBucket:
+    def __init__(self, blobs):
+        self.blobs = {blob.name: blob for blob in blobs}
+
+    def list_blobs(self, prefix="", timeout=None):
+        return [blob for name, blob in self.blobs.items() if name.startswith(prefix)]
+
+    def blob(self, name):
+        return self.blobs[name]
+
+
+class FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+def make_importer(blobs, **kwargs):
+    importer = DecisionImporter("bucket", "decizii-cnsc", skip_embeddings=True, **kwargs)
+    importer.bucket = FakeBucket(blobs)
+    return importer
+
+
+class TestBasename:
+    """Tests for _basename."""
+
+    @pytest.mark.parametrize("blob_name,expected", [
+        ("decizii-cnsc/BO2025_1_D1_A.txt", "BO2025_1_D1_A.txt"),
+        ("a/b/c/BO2025_1_D1_A.txt", "BO2025_1_D1_A.txt"),
+        ("BO2025_1_D1_A.txt", "BO2025_1_D1_A.txt"),
+    ])
+    def test_basename(self, blob_name, expected):
+        assert _basename(blob_name) == expected
+
+
+class TestLogLevel:
+    """Tests for the --log-level filter (also the parse workers' initializer)."""
+
+    def test_configure_log_level_drops_lower_levels(self, capsys):
+        try:
+            _configure_log_level("WARNING")
+            log = structlog.get_logger("importer-test")
+            log.debug("decision_parsed")
+            log.warning("batch_commit_failed")
+        finally:
+            structlog.reset_defaults()
+
+        out = capsys.readouterr().out
+        assert "decision_parsed" not in out
+        assert "batch_commit_failed" in out
+
+
+class TestIterNewFiles:
+    """Tests for listing and filtering GCS blobs."""
+
+    def test_skips_existing_and_non_txt(self):
+        importer = make_importer([
+            FakeBlob("decizii-cnsc/BO2025_1_D1_A.txt", md5_hash="m1"),
+            FakeBlob("decizii-cnsc/BO2025_2_D1_A.txt", md5_hash="m2"),
+            FakeBlob("decizii-cnsc/readme.pdf"),
+        ])
+        counts = {}
+
+        names = list(importer.iter_new_files({"BO2025_1_D1_A.txt"}, counts))
+
+        assert names == ["decizii-cnsc/BO2025_2_D1_A.txt"]
+        assert counts == {"seen": 3, "new": 1, "already_existed": 1}
+        assert importer._blob_md5 == {"decizii-cnsc/BO2025_2_D1_A.txt": "m2"}
+
+    def test_limit_and_since_prefix(self):
+        importer = make_importer([
+            FakeBlob("decizii-cnsc/BO2024_1_D1_A.txt"),
+            FakeBlob("decizii-cnsc/BO2025_1_D1_A.txt"),
+            FakeBlob("decizii-cnsc/BO2025_2_D1_A.txt"),
+        ])
+        counts = {}
+
+        names = list(importer.iter_new_files(set(), counts, limit=1, since="BO2025_"))
+
+        assert names == ["decizii-cnsc/BO2025_1_D1_A.txt"]
+        assert counts["new"] == 1
+
+
+class TestParseCache:
+    """Tests for the md5 + parser-version parse cache."""
+
+    def test_cache_key_requires_md5(self):
+        importer = make_importer([])
+        importer._blob_md5["with-md5.txt"] = "abc"
+
+        assert importer._parse_cache_key("with-md5.txt").endswith(":abc")
+        assert importer._parse_cache_key("without-md5.txt") is None
+        assert importer._cached_result({None: ("skipped", "x")}, "without-md5.txt") is None
+
+    @pytest.mark.asyncio
+    async def test_skipped_file_is_cached_and_not_downloaded_again(
+        self, tmp_path, monkeypatch, sample_decision_text_admis
+    ):
+        valid = FakeBlob(VALID_BLOB, sample_decision_text_admis.encode("utf-8"), md5_hash="v1")
+        invalid = FakeBlob(INVALID_BLOB, b"not a decision", md5_hash="i1")
+        inserted_rows = []
+
+        async def load_nothing():
+            return set()
+
+        async def load_no_bo():
+            return {}
+
+        async def load_no_cpv():
+            return {}
+
+        async def insert_rows(session, rows):
+            inserted_rows.extend(rows)
+            return {row["filename"] for row in rows}, {}
+
+        monkeypatch.setattr(importer_module.db_session, "async_session_factory", FakeSession)
+
+        async def run():
+            importer = make_importer([valid, invalid], parse_cache_path=str(tmp_path / "cache"))
+            importer._load_existing_filenames = load_nothing
+            importer._load_existing_bo_numbers = load_no_bo
+            importer._load_cpv_nomenclator = load_no_cpv
+            importer._insert_rows = insert_rows
+            return await importer.import_all(batch_size=10)
+
+        first = await run()
+        assert (first["imported"], first["skipped"]) == (1, 1)
+        assert (valid.downloads, invalid.downloads) == (1, 1)
+
+        # Cache hit: the skipped file is counted from the cache, not re-fetched;
+        # the valid file was never cached, so it is downloaded again (miss)
+        second = await run()
+        assert (second["imported"], second["skipped"]) == (1, 1)
+        assert second["skipped_files"] == first["skipped_files"]
+        assert (valid.downloads, invalid.downloads) == (2, 1)
+        assert [row["filename"] for row in inserted_rows] == [_basename(VALID_BLOB)] * 2
+
+
+class TestPrepareDecision:
+    """Tests for turning parser output into insert rows."""
+
+    def test_prepared_row(self, parsed_admis):
+        importer = make_importer([])
+        existing_filenames = set()
+        existing_bo = {}
+        cpv_map = {"55520000-1": {"descriere": "Servicii de catering", "categorie": "servicii", "clasa": "55"}}
+
+        status, row, error = importer.prepare_decision(
+            VALID_BLOB, parsed_admis, existing_filenames, existing_bo, cpv_map=cpv_map
+        )
+
+        assert (status, error) == ("prepared", None)
+        assert row["filename"] == "BO2025_3855_R2_CPV_55520000-1_A.txt"
+        assert (row["an_bo"], row["numar_bo"]) == (2025, 3855)
+        assert row["text_integral"] == parsed_admis.text_integral
+        assert row["solutie_contestatie"] == parsed_admis.solutie_contestatie.value
+        assert row["cpv_descriere"] == "Servicii de catering"
+        assert set(row) <= {column.name for column in importer_module.DecizieCNSC.__table__.columns}
+        # Recorded so repeats later in the run are caught
+        assert row["filename"] in existing_filenames
+        assert existing_bo[(2025, 3855)] == row["id"]
+
+    def test_duplicate_by_bo_number(self, parsed_admis):
+        importer = make_importer([])
+
+        status, row, error = importer.prepare_decision(
+            VALID_BLOB, parsed_admis, set(), {(2025, 3855): "existing-id"}
+        )
+
+        assert (status, row, error) == ("already_existed", None, None)
+
+    def test_invalid_bo_metadata_is_skipped(self, parser):
+        importer = make_importer([])
+        parsed = parser.parse_text("DECIZIE", source_file="notes.txt")
+
+        status, row, error = importer.prepare_decision(INVALID_BLOB, parsed, set(), {})
+
+        assert status == "skipped"
+        assert row is None
+        assert error.startswith("notes.txt: Invalid BO metadata")
@@ -6,31 +6,37 @@ Tests the parser following the established conventions:
 - Solution codes: A (Admis), R (Respins), X (Unknown)
 """
 
-import pytest
+import re
+import sys
 from datetime import datetime
+from unittest.mock import patch
+
+import pytest
 
 from app.services.parser import (
     CNSCDecisionParser,
     CriticismCodeType,
+    ParsedDecision,
     SolutionCode,
     SolutionType,
     SectionType,
     CRITICISM_CODES_LEGEND,
     get_criticism_type,
     get_criticism_description,
+    parse_decision_file,
     parse_decision_text,
+    parse_decision_files,
     get_all_criticism_codes,
+    MAX_TEXT_CRITICISM_CODES,
+    HEADER_WINDOW,
+    _build_procedure_re,
+    _WS_TRANS,
 )
 
 
 class TestFilenameParser:
     """Tests for filename parsing."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance."""
-        return CNSCDecisionParser()
-
     def test_parse_filename_with_cpv(self, parser, sample_filename_with_cpv):
         """Parser should correctly parse filename with CPV code."""
         meta = parser._parse_filename(sample_filename_with_cpv)
@@ -64,6 +70,18 @@ class TestFilenameParser:
         assert meta.solutie == SolutionCode.UNKNOWN
         assert meta.tip_contestatie == CriticismCodeType.RESULT
 
+    def test_parse_filename_subpoints_and_shorthand(self, parser):
+        """Sub-points collapse to base codes and RA/DA expand to RAL/DAL."""
+        meta = parser._parse_filename("BO2025_1234_R2.2.2,R4_RA_CPV_A.txt")
+
+        assert meta.coduri_critici == ["R2", "R4", "RAL"]
+        assert meta.tip_contestatie == CriticismCodeType.RESULT
+
+        meta = parser._parse_filename("BO2025_1234_da_D1.1_X.txt")
+
+        assert meta.coduri_critici == ["DAL", "D1"]
+        assert meta.tip_contestatie == CriticismCodeType.DOCUMENTATION
+
     def test_parse_invalid_filename(self, parser):
         """Parser should raise ValueError for invalid filename."""
         with pytest.raises(ValueError):
@@ -122,26 +140,42 @@ class TestCriticismCodes:
 class TestTextParser:
     """Tests for text content parsing."""
 
-    @pytest.fixture
-    def parser(self):
-        return CNSCDecisionParser()
-
-    def test_extract_admis_solution(self, parser, sample_decision_text_admis):
+    def test_extract_admis_solution(self, parsed_admis):
         """Parser should extract ADMIS solution from dispositive."""
-        result = parser.parse_text(
-            sample_decision_text_admis,
-            source_file="BO2025_3855_R2_CPV_55520000-1_A.txt"
-        )
-        assert result.solutie_contestatie == SolutionType.ADMIS
+        assert parsed_admis.solutie_contestatie == SolutionType.ADMIS
 
-    def test_extract_respins_solution(self, parser, sample_decision_text_respins):
+    def test_extract_respins_solution(self, parsed_respins):
         """Parser should extract RESPINS solution from dispositive."""
-        result = parser.parse_text(
-            sample_decision_text_respins,
-            source_file="BO2025_1234_D1_D4_CPV_45233140-2_R.txt"
+        assert parsed_respins.solutie_contestatie == SolutionType.RESPINS
+        assert parsed_respins.motiv_respingere == "nefondată"
+
+    def test_extract_rejection_reason_from_context(self, parser):
+        """Parser should find a known rejection reason anywhere in the dispositive."""
+        text = (
+            "CONSILIUL DECIDE:\n"
+            "Respinge, ca neîntemeiată, contestația formulată de S.C. X S.R.L., "
+            "fiind RĂMASĂ FĂRĂ OBIECT."
         )
+        result = parser.parse_text(text, source_file="BO2025_1234_D1_R.txt")
         assert result.solutie_contestatie == SolutionType.RESPINS
-        assert result.motiv_respingere == "nefondată"
+        assert result.motiv_respingere == "rămasă fără obiect"
+
+    def test_extract_parties(self, parsed_admis):
+        """Parser should extract contestator and contracting authority."""
+        assert parsed_admis.contestator == "S.C. CONSTRUCTII MODERNE S.R.L."
+        assert parsed_admis.autoritate_contractanta == "Primăria Municipiului București"
+
+    def test_extract_party_with_comma(self, parser):
+        """Party names may contain commas; they stop only at ", în" or newline."""
+        text = "Contestator: S.C. ALFA, BETA S.R.L., în calitate de lider\n"
+        result = parser.parse_text(text, source_file="BO2025_1234_D1_X.txt")
+        assert result.contestator == "S.C. ALFA, BETA S.R.L."
+
+    def test_extract_party_with_unicode_spaces(self, parser):
+        """Thin, narrow no-break and ideographic spaces collapse to one space."""
+        text = "Contestator: S.C.\u2009ALFA\u202f\u3000CONSTRUCT S.R.L., în calitate de lider\n"
+        result = parser.parse_text(text, source_file="BO2025_1234_D1_X.txt")
+        assert result.contestator == "S.C. ALFA CONSTRUCT S.R.L."
 
     def test_extract_admis_partial_solution(self, parser, sample_decision_text_admis_partial):
         """Parser should extract ADMIS_PARTIAL solution from dispositive."""
@@ -151,72 +185,127 @@ class TestTextParser:
         )
         assert result.solutie_contestatie == SolutionType.ADMIS_PARTIAL
 
-    def test_extract_decision_header(self, parser, sample_decision_text_admis):
+    def test_extract_decision_header(self, parsed_admis):
         """Parser should extract decision number and panel."""
-        result = parser.parse_text(
-            sample_decision_text_admis,
-            source_file="BO2025_3855_R2_CPV_55520000-1_A.txt"
-        )
+        assert parsed_admis.complet == "C8"
+        assert parsed_admis.numar_decizie == 4446
+
+    def test_decision_header_ignores_cited_decisions(self, parser):
+        """Decision numbers cited deep in the body must not be taken as the header."""
+        text = "DECIZIE\nNr. ...\n" + "x" * 5000 + "\ndecizia CNSC nr. 1018/C8/712"
+        result = parser.parse_text(text, source_file="BO2025_1234_D1_X.txt")
+        assert result.numar_decizie is None
+        assert result.complet is None
+
+    def test_decision_header_uppercase(self, parser):
+        """The header match is case-insensitive ("NR." as well as "Nr.")."""
+        text = "DECIZIE\nNR. 3754/C8/4446\nData: 10.12.2025"
+        result = parser.parse_text(text, source_file="BO2025_3754_D1_X.txt")
         assert result.complet == "C8"
         assert result.numar_decizie == 4446
 
-    def test_extract_date(self, parser, sample_decision_text_admis):
+    @pytest.mark.parametrize("offset", [6, 12, 16])
+    def test_decision_header_at_window_edge(self, parser, offset):
+        """A header straddling HEADER_WINDOW is read whole, not cut at the edge."""
+        text = "x" * (HEADER_WINDOW - offset) + " Nr. 3754/C8/4446\n"
+        result = parser.parse_text(text, source_file="BO2025_3754_D1_X.txt")
+        assert result.complet == "C8"
+        assert result.numar_decizie == 4446
+
+    def test_extract_date(self, parsed_admis):
         """Parser should extract decision date."""
-        result = parser.parse_text(
-            sample_decision_text_admis,
-            source_file="BO2025_3855_R2_CPV_55520000-1_A.txt"
-        )
-        assert result.data_decizie == datetime(2025, 12, 10)
+        assert parsed_admis.data_decizie == datetime(2025, 12, 10)
 
-    def test_extract_cpv_from_text(self, parser, sample_decision_text_admis):
+    def test_extract_cpv_from_text(self, parsed_admis):
         """Parser should extract CPV code from text."""
-        result = parser.parse_text(
-            sample_decision_text_admis,
-            source_file="BO2025_3855_R2_CPV_55520000-1_A.txt"
-        )
-        assert result.cod_cpv == "55520000-1"
+        assert parsed_admis.cod_cpv == "55520000-1"
 
-    def test_extract_criticism_codes_from_text(self, parser, sample_decision_text_respins):
+    def test_extract_criticism_codes_from_text(self, parsed_respins):
         """Parser should extract criticism codes from text."""
-        result = parser.parse_text(
-            sample_decision_text_respins,
-            source_file="BO2025_1234_D1_D4_CPV_45233140-2_R.txt"
-        )
-        assert "D1" in result.coduri_critici
-        assert "D4" in result.coduri_critici
+        assert "D1" in parsed_respins.coduri_critici
+        assert "D4" in parsed_respins.coduri_critici
+
+    def test_text_criticism_codes_deduped_in_order(self, parser):
+        """Codes found in the text keep first-seen order, upper-cased, once each."""
+        text = "Critici: d2, R1, D2 și r1; apoi DAL, R1."
+        result = parser.parse_text(text)
+        assert result.coduri_critici == ["D2", "R1", "DAL"]
+
+    def test_text_criticism_codes_stop_after_all_seen(self, parser, monkeypatch):
+        """The scan stops at the match that completes the set of possible codes."""
+        all_codes = [f"D{i}" for i in range(1, 9)] + [f"R{i}" for i in range(1, 9)] + ["DAL", "RAL"]
+        assert len(all_codes) == MAX_TEXT_CRITICISM_CODES
+        text = " ".join(all_codes + ["D1"] * 50)
+
+        pattern = CNSCDecisionParser.PATTERNS["criticism"]
+        consumed = []
+
+        class CountingPattern:
+            def finditer(self, string):
+                for match in pattern.finditer(string):
+                    consumed.append(match)
+                    yield match
+
+        monkeypatch.setitem(CNSCDecisionParser.PATTERNS, "criticism", CountingPattern())
+        result = parser.parse_text(text)
+
+        assert result.coduri_critici == all_codes
+        assert len(consumed) == MAX_TEXT_CRITICISM_CODES
 
 
 class TestContestType:
     """Tests for contest type determination."""
 
-    @pytest.fixture
-    def parser(self):
-        return CNSCDecisionParser()
-
-    def test_documentation_contest_type(self, parser, sample_decision_text_respins):
+    def test_documentation_contest_type(self, parsed_respins):
         """D* codes should result in DOCUMENTATION contest type."""
-        result = parser.parse_text(
-            sample_decision_text_respins,
-            source_file="BO2025_1234_D1_D4_CPV_45233140-2_R.txt"
-        )
-        assert result.tip_contestatie == CriticismCodeType.DOCUMENTATION
+        assert parsed_respins.tip_contestatie == CriticismCodeType.DOCUMENTATION
 
-    def test_result_contest_type(self, parser, sample_decision_text_admis):
+    def test_result_contest_type(self, parsed_admis):
         """R* codes should result in RESULT contest type."""
-        result = parser.parse_text(
-            sample_decision_text_admis,
-            source_file="BO2025_3855_R2_CPV_55520000-1_A.txt"
-        )
-        assert result.tip_contestatie == CriticismCodeType.RESULT
+        assert parsed_admis.tip_contestatie == CriticismCodeType.RESULT
+
+
+class TestProcedureType:
+    """Tests for procedure-type extraction."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("prin procedura simplificată, apoi licitație deschisă", "licitatie_deschisa"),
+        ("dialogul competitiv și concursul de soluții", "dialog_competitiv"),
+        ("procedură simplificată", "procedura_simplificata"),
+        ("PROCEDURA DE LICITAȚIE DESCHISĂ", "licitatie_deschisa"),
+        ("fără mențiuni relevante", None),
+    ])
+    def test_single_scan_keeps_priority(self, parser, text, expected):
+        """The highest-priority type wins regardless of position in the text."""
+        assert parser._extract_tip_procedura(text) == expected
+
+    @pytest.mark.parametrize("source", [r"(?:procedura)\s+simplificat", r"\bprocedura", r"p?rocedura"])
+    def test_patterns_must_start_with_a_letter(self, source):
+        """A pattern the first-letter lookahead would hide is rejected at build time."""
+        patterns = dict(CNSCDecisionParser.PATTERNS, proc_simplificata=re.compile(source))
+        with pytest.raises(ValueError, match="proc_simplificata"):
+            _build_procedure_re(patterns)
+
+
+class TestLegislativeDomain:
+    """Tests for legislative-domain extraction."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("conform Legii nr. 100/2016 privind concesiunile", "concesiuni"),
+        ("conform Legii nr. 99/2016 privind achizițiile sectoriale", "achizitii_sectoriale"),
+        ("Legea nr. 98/2016 și Legea nr. 100/2016", "achizitii_publice"),
+        ("H.G. nr. 395/2016 și Legea nr. 99/2016", "achizitii_publice"),
+        ("H.G. nr. 394/2016", "achizitii_sectoriale"),
+        ("fără referințe legislative", "achizitii_publice"),
+    ])
+    def test_anchored_checks(self, parser, text, expected):
+        """Literal law anchors pick the domain; Legea 98/2016 and H.G. 395/2016 win."""
+        assert parser._extract_domeniu_legislativ(text) == expected
 
 
 class TestSectionParsing:
     """Tests for section parsing."""
 
-    @pytest.fixture
-    def parser(self):
-        return CNSCDecisionParser()
-
     def test_parse_sections(self, parser, sample_decision_text_with_sections):
         """Parser should identify major sections."""
         result = parser.parse_text(
@@ -236,59 +325,31 @@ class TestSectionParsing:
 class TestExternalId:
     """Tests for external ID generation."""
 
-    @pytest.fixture
-    def parser(self):
-        return CNSCDecisionParser()
-
-    def test_external_id_format(self, parser, sample_decision_text_admis):
+    def test_external_id_format(self, parsed_admis):
         """External ID should follow BO{year}_{number} format."""
-        result = parser.parse_text(
-            sample_decision_text_admis,
-            source_file="BO2025_3855_R2_CPV_55520000-1_A.txt"
-        )
-        assert result.external_id == "BO2025_3855"
+        assert parsed_admis.external_id == "BO2025_3855"
 
 
 class TestTitle:
     """Tests for title generation."""
 
-    @pytest.fixture
-    def parser(self):
-        return CNSCDecisionParser()
-
-    def test_title_includes_bo_and_number(self, parser, sample_decision_text_admis):
+    def test_title_includes_bo_and_number(self, parsed_admis):
         """Title should include BO year and number."""
-        result = parser.parse_text(
-            sample_decision_text_admis,
-            source_file="BO2025_3855_R2_CPV_55520000-1_A.txt"
-        )
-        assert "BO2025" in result.title
-        assert "3855" in result.title
+        assert "BO2025" in parsed_admis.title
+        assert "3855" in parsed_admis.title
 
-    def test_title_includes_solution(self, parser, sample_decision_text_admis):
+    def test_title_includes_solution(self, parsed_admis):
         """Title should include solution."""
-        result = parser.parse_text(
-            sample_decision_text_admis,
-            source_file="BO2025_3855_R2_CPV_55520000-1_A.txt"
-        )
-        assert "ADMIS" in result.title
+        assert "ADMIS" in parsed_admis.title
 
-    def test_title_includes_critici(self, parser, sample_decision_text_respins):
+    def test_title_includes_critici(self, parsed_respins):
         """Title should include criticism codes."""
-        result = parser.parse_text(
-            sample_decision_text_respins,
-            source_file="BO2025_1234_D1_D4_CPV_45233140-2_R.txt"
-        )
-        assert "D1" in result.title or "D4" in result.title
+        assert "D1" in parsed_respins.title or "D4" in parsed_respins.title
 
 
 class TestValidation:
     """Tests for validation and reconciliation."""
 
-    @pytest.fixture
-    def parser(self):
-        return CNSCDecisionParser()
-
     def test_warning_for_missing_cpv(self, parser):
         """Parser should add warning when CPV is not found."""
         text = "Simple text without CPV code"
@@ -316,3 +377,115 @@ class TestConvenienceFunctions:
         )
         assert result.solutie_contestatie == SolutionType.ADMIS
         assert result.numar_bo == 3855
+
+    def test_parse_decision_files(
+        self, tmp_path, sample_decision_text_admis, sample_decision_text_respins
+    ):
+        """Batch helper should parse every file and preserve input order."""
+        first = tmp_path / "BO2025_3855_R2_CPV_55520000-1_A.txt"
+        second = tmp_path / "BO2025_1234_D1_D4_CPV_45233140-2_R.txt"
+        first.write_text(sample_decision_text_admis, encoding="utf-8")
+        second.write_text(sample_decision_text_respins, encoding="utf-8")
+
+        results = list(parse_decision_files([first, second], workers=2))
+
+        assert [r.numar_bo for r in results] == [3855, 1234]
+        assert results[0].solutie_contestatie == SolutionType.ADMIS
+        assert results[1].solutie_contestatie == SolutionType.RESPINS
+
+    def test_parse_decision_files_stops_early(self, tmp_path, sample_decision_text_admis):
+        """Closing the generator early should not parse the remaining files."""
+        paths = []
+        for i in range(20):
+            path = tmp_path / f"BO2025_{3000 + i}_R2_CPV_55520000-1_A.txt"
+            path.write_text(sample_decision_text_admis, encoding="utf-8")
+            paths.append(path)
+
+        results = parse_decision_files(iter(paths), workers=1)
+        first = next(results)
+        results.close()
+
+        assert first.numar_bo == 3000
+
+    def test_parse_decision_file_encodings(self, tmp_path):
+        """File parsing should strip a UTF-8 BOM and fall back to latin-1."""
+        bom_file = tmp_path / "BO2025_1111_D1_X.txt"
+        bom_file.write_bytes(b"\xef\xbb\xbfDECIZIE Nr. 1111/C1/22")
+        latin_file = tmp_path / "BO2025_2222_D1_X.txt"
+        latin_file.write_bytes(b"DECIZIE Nr. 2222/C2/33 Cr\xe9dit")
+
+        bom_result = parse_decision_file(bom_file)
+        latin_result = parse_decision_file(latin_file)
+
+        assert bom_result.load_text().startswith("DECIZIE")
+        assert bom_result.numar_decizie == 22
+        assert latin_result.numar_decizie == 33
+        assert latin_result.load_text().endswith("Crédit")
+
+    def test_parse_decision_file_reads_text_lazily(self, tmp_path, sample_decision_text_admis):
+        """Parsing from disk shouldn't hold the text; load_text() reads it once."""
+        path = tmp_path / "BO2025_3855_R2_CPV_55520000-1_A.txt"
+        path.write_text(sample_decision_text_admis, encoding="utf-8")
+
+        result = parse_decision_file(path)
+
+        assert result.text_integral is None
+        assert result.load_text() == sample_decision_text_admis
+        path.unlink()
+        assert result.load_text() == sample_decision_text_admis
+
+    def test_load_text_missing_source_file(self, tmp_path, sample_decision_text_admis):
+        """load_text() should raise when the text was dropped and the file is gone."""
+        path = tmp_path / "BO2025_3855_R2_CPV_55520000-1_A.txt"
+        path.write_text(sample_decision_text_admis, encoding="utf-8")
+
+        result = parse_decision_file(path)
+        path.unlink()
+
+        with pytest.raises(FileNotFoundError):
+            result.load_text()
+
+    def test_parsed_decision_accepts_text_integral(self):
+        """text_integral is a regular init field."""
+        decision = ParsedDecision(
+            filename="BO2025_1_D1_A.txt", numar_bo=1, an_bo=2025, text_integral="DECIZIE"
+        )
+
+        assert decision.text_integral == "DECIZIE"
+        assert decision.load_text() == "DECIZIE"
+
+
+class TestCompiledPatterns:
+    """Regexes are compiled once at import, not per parse."""
+
+    def test_patterns_are_precompiled(self):
+        assert all(isinstance(p, re.Pattern) for p in CNSCDecisionParser.PATTERNS.values())
+        assert isinstance(CNSCDecisionParser.FILENAME_PATTERN, re.Pattern)
+
+    @pytest.mark.parametrize("func", [
+        "compile", "search", "match", "fullmatch", "findall", "finditer", "sub", "split",
+    ])
+    def test_parse_compiles_no_inline_patterns(self, parser, sample_decision_text_admis, func):
+        """Parsing a decision must not build regexes from string patterns."""
+        with patch.object(re, func, wraps=getattr(re, func)) as spy:
+            parser.parse_text(
+                sample_decision_text_admis,
+                source_file="BO2025_3855_R2_CPV_55520000-1_A.txt",
+            )
+
+        inline = [c.args[0] for c in spy.call_args_list if isinstance(c.args[0], str)]
+        assert inline == []
+
+    def test_whitespace_table_matches_isspace(self):
+        """The explicit whitespace list covers exactly what \\s matches."""
+        expected = {c for c in range(sys.maxunicode + 1) if chr(c).isspace()} - {0x20}
+        assert set(_WS_TRANS) == expected
+
+    @pytest.mark.parametrize("name,anonymized", [
+        ("SC (...) S.R.L.", True),
+        ("......... SRL", True),
+        ("(xxx)", True),
+        ("SC Construct Grup SRL", False),
+    ])
+    def test_is_anonymized(self, name, anonymized):
+        assert CNSCDecisionParser._is_anonymized(name) is anonymized
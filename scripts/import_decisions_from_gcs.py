@@ -15,16 +15,27 @@ Usage:
 
 import asyncio
 import argparse
+import hashlib
+import inspect
+import json
+import logging
+import multiprocessing
+import shelve
 import sys
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from decimal import Decimal
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+from uuid import uuid4
 
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 
+import structlog
 from google.cloud import storage
-from sqlalchemy import select, text
+from sqlalchemy import JSON, Numeric, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
@@ -34,10 +45,43 @@ from app.db import session as db_session
 from app.models.decision import DecizieCNSC, ArgumentareCritica, NomenclatorCPV
 from app.services.analysis import DecisionAnalysisService
 from app.services.embedding import EmbeddingService
-from app.services.parser import parse_decision_text
+from app.services.parser import ParsedDecision, parse_decision_text
 
 logger = get_logger(__name__)
 
+# Parallel GCS downloads (network-bound, so threads are enough)
+DOWNLOAD_CONCURRENCY = 16
+
+# Per-column conversions for COPY, which bypasses SQLAlchemy's bind processing
+_COPY_ADAPTERS = {
+    column.name: json.dumps if isinstance(column.type, JSON) else (lambda v: Decimal(str(v)))
+    for column in DecizieCNSC.__table__.columns
+    if isinstance(column.type, (JSON, Numeric))
+}
+
+
+# Parse-cache entries are only valid for the parser version that made them
+_PARSER_FINGERPRINT = hashlib.md5(
+    Path(inspect.getsourcefile(parse_decision_text)).read_bytes()
+).hexdigest()[:12]
+
+
+def _configure_log_level(level: str) -> None:
+    """Drop log calls below ``level``.
+
+    Filtered-out calls return before any event dict is built or rendered.
+    Also runs as the parse workers' initializer: spawned processes start
+    with structlog's default (unfiltered) configuration.
+    """
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.getLevelName(level))
+    )
+
+
+def _basename(blob_name: str) -> str:
+    """File name of a GCS object (object names always use "/")."""
+    return blob_name.rsplit("/", 1)[-1]
+
 
 class DecisionImporter:
     """Import CNSC decisions from GCS to database."""
@@ -48,13 +92,21 @@ class DecisionImporter:
         folder_name: str,
         project_id: Optional[str] = None,
         skip_embeddings: bool = False,
+        parse_cache_path: Optional[str] = None,
+        use_copy: bool = False,
+        log_level: str = "INFO",
     ):
         self.bucket_name = bucket_name
         self.folder_name = folder_name
         self.project_id = project_id
         self.skip_embeddings = skip_embeddings
+        self.parse_cache_path = parse_cache_path
+        self.use_copy = use_copy
+        self.log_level = log_level
         self.storage_client = None
         self.bucket = None
+        # blob name -> GCS md5_hash, filled while listing
+        self._blob_md5: dict[str, str] = {}
 
     def connect_to_gcs(self) -> None:
         """Connect to GCS bucket."""
@@ -74,21 +126,26 @@ class DecisionImporter:
             logger.error("gcs_connection_failed", error=str(e))
             raise
 
-    def list_new_files(
+    def iter_new_files(
         self,
         existing_filenames: set[str],
+        counts: dict[str, int],
         limit: Optional[int] = None,
         since: Optional[str] = None,
-    ) -> tuple[list[str], int]:
-        """List only NEW decision files by filtering against existing DB filenames during GCS iteration.
+    ) -> Iterator[str]:
+        """Yield only NEW decision files by filtering against existing DB filenames during GCS iteration.
+
+        Names are yielded as listing pages arrive, so imports can start
+        before the whole bucket has been listed.
 
         Args:
             existing_filenames: Set of filenames already in DB.
-            limit: Maximum number of new files to return.
+            counts: Updated in place with "seen", "new" and "already_existed".
+            limit: Maximum number of new files to yield.
             since: Only list files with names starting with this prefix (e.g. "BO2026_" for year 2026).
 
-        Returns:
-            Tuple of (new_file_blob_names, already_existed_count).
+        Yields:
+            Blob names of new decision files.
         """
         prefix = f"{self.folder_name}/" if self.folder_name else ""
         if since:
@@ -96,29 +153,34 @@ class DecisionImporter:
             logger.info("gcs_listing_with_prefix", prefix=prefix)
         blobs = self.bucket.list_blobs(prefix=prefix, timeout=300)
 
-        new_files = []
-        total_seen = 0
-        already_existed = 0
+        counts.update(seen=0, new=0, already_existed=0)
         for blob in blobs:
-            total_seen += 1
-            if total_seen % 500 == 0:
-                logger.info("gcs_listing_progress", seen=total_seen, new=len(new_files), skipped=already_existed)
+            counts["seen"] += 1
+            if counts["seen"] % 500 == 0:
+                logger.info(
+                    "gcs_listing_progress",
+                    seen=counts["seen"],
+                    new=counts["new"],
+                    skipped=counts["already_existed"],
+                )
             if blob.name.endswith('.txt'):
-                fname = Path(blob.name).name
+                fname = _basename(blob.name)
                 if fname in existing_filenames:
-                    already_existed += 1
+                    counts["already_existed"] += 1
                 else:
-                    new_files.append(blob.name)
-                    if limit and len(new_files) >= limit:
+                    counts["new"] += 1
+                    if blob.md5_hash:
+                        self._blob_md5[blob.name] = blob.md5_hash
+                    yield blob.name
+                    if limit and counts["new"] >= limit:
                         break
 
         logger.info(
             "gcs_files_listed",
-            total_seen=total_seen,
-            new=len(new_files),
-            already_existed=already_existed,
+            total_seen=counts["seen"],
+            new=counts["new"],
+            already_existed=counts["already_existed"],
         )
-        return new_files, already_existed
 
     def download_file(self, blob_name: str) -> str:
         """Download a file from GCS and return its content.
@@ -131,38 +193,94 @@ class DecisionImporter:
         """
         blob = self.bucket.blob(blob_name)
 
+        # Download once and decode locally so the latin-1 fallback doesn't
+        # cost a second request
+        data = blob.download_as_bytes(timeout=120)
         try:
-            content = blob.download_as_text(encoding='utf-8', timeout=120)
+            return data.decode('utf-8')
         except UnicodeDecodeError:
             # Fallback to latin-1
-            content = blob.download_as_text(encoding='latin-1', timeout=120)
+            return data.decode('latin-1')
 
-        return content
+    def _parse_cache_key(self, blob_name: str) -> Optional[str]:
+        """Cache key for a blob: its content hash plus the parser version."""
+        md5 = self._blob_md5.get(blob_name)
+        return f"{_PARSER_FINGERPRINT}:{md5}" if md5 else None
 
-    async def import_decision(
+    def _cached_result(self, parse_cache, blob_name: str) -> Optional[tuple[str, str]]:
+        """(status, message) remembered for an unchanged blob, if any."""
+        key = self._parse_cache_key(blob_name)
+        return parse_cache.get(key) if key else None
+
+    async def _download_batch(
+        self,
+        executor: ThreadPoolExecutor,
+        batch: list[str],
+    ) -> tuple[dict[str, str], list[tuple[str, Exception]]]:
+        """Download a batch of blobs concurrently on the shared executor.
+
+        Returns:
+            Tuple of (blob_name -> content, [(blob_name, error), ...]).
+        """
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(executor, self.download_file, blob_name) for blob_name in batch),
+            return_exceptions=True,
+        )
+        downloaded = {}
+        failures = []
+        for blob_name, result in zip(batch, results):
+            if isinstance(result, Exception):
+                failures.append((blob_name, result))
+            else:
+                downloaded[blob_name] = result
+        return downloaded, failures
+
+    async def _parse_batch(
+        self,
+        pool: ProcessPoolExecutor,
+        downloaded: dict[str, str],
+    ) -> list[tuple[str, ParsedDecision | Exception]]:
+        """Parse downloaded decisions in worker processes (parsing is CPU-bound)."""
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(pool, parse_decision_text, content, _basename(blob_name))
+                for blob_name, content in downloaded.items()
+            ),
+            return_exceptions=True,
+        )
+        return list(zip(downloaded, results))
+
+    def prepare_decision(
         self,
-        session: AsyncSession,
         blob_name: str,
-        content: str,
+        parsed: ParsedDecision,
+        existing_filenames: set[str],
+        existing_bo: dict[tuple[int, int], str],
         cpv_map: dict | None = None,
-    ) -> tuple[str, Optional[str], Optional[str]]:
-        """Parse and import a single decision.
+    ) -> tuple[str, Optional[dict], Optional[str]]:
+        """Turn a parsed decision into a row for the batch insert.
+
+        Duplicates are detected in memory; a prepared row is recorded in
+        ``existing_filenames``/``existing_bo`` so repeats later in the run
+        are caught too.
 
         Args:
-            session: Database session
             blob_name: Name of the file in GCS
-            content: File content
+            parsed: Parser output for the file
+            existing_filenames: Filenames already in DB
+            existing_bo: (an_bo, numar_bo) -> decision id already in DB
+            cpv_map: CPV nomenclator for enrichment
 
         Returns:
-            Tuple of (status, decision_id, error_message) where status is one of:
-            "imported", "already_existed", "skipped", "failed"
+            Tuple of (status, row, error_message) where status is one of:
+            "prepared", "already_existed", "skipped", "failed" and row is
+            the column dict for DecizieCNSC when status is "prepared"
         """
-        filename = Path(blob_name).name
+        filename = _basename(blob_name)
 
         try:
-            # Parse decision
-            parsed = parse_decision_text(content, source_file=filename)
-
             # Skip decisions with invalid parsing (an_bo=0 or numar_bo=0)
             # These would violate the unique constraint ix_decizii_bo_unique
             if parsed.an_bo == 0 or parsed.numar_bo == 0:
@@ -181,69 +299,55 @@ class DecisionImporter:
                 return ("skipped", None, f"{filename}: {reason}")
 
             # Check if already exists (by filename OR by BO number)
-            result = await session.execute(
-                select(DecizieCNSC).where(
-                    (DecizieCNSC.filename == filename) |
-                    ((DecizieCNSC.an_bo == parsed.an_bo) & (DecizieCNSC.numar_bo == parsed.numar_bo))
-                )
-            )
-            existing = result.scalar_one_or_none()
-
-            if existing:
-                logger.info("decision_already_exists", filename=filename, id=existing.id)
-                return ("already_existed", existing.id, None)
-
-            # Create database record
-            decision = DecizieCNSC(
-                filename=parsed.filename,
-                numar_bo=parsed.numar_bo,
-                an_bo=parsed.an_bo,
-                numar_decizie=parsed.numar_decizie,
-                complet=parsed.complet,
-                data_decizie=parsed.data_decizie,
-                tip_contestatie=parsed.tip_contestatie.value,
-                coduri_critici=parsed.coduri_critici,
-                cod_cpv=parsed.cod_cpv,
-                cpv_source=parsed.cpv_source,
-                solutie_filename=parsed.solutie_filename.value,
-                solutie_contestatie=parsed.solutie_contestatie.value if parsed.solutie_contestatie else None,
-                motiv_respingere=parsed.motiv_respingere,
-                contestator=parsed.contestator,
-                autoritate_contractanta=parsed.autoritate_contractanta,
-                intervenienti=parsed.intervenienti,
-                text_integral=parsed.text_integral,
-                obiect_contract=parsed.obiect_contract,
-                criteriu_atribuire=parsed.criteriu_atribuire,
-                numar_oferte=parsed.numar_oferte,
-                valoare_estimata=parsed.valoare_estimata,
-                moneda=parsed.moneda,
-                numar_anunt_participare=parsed.numar_anunt_participare,
-                data_raport_procedura=parsed.data_raport_procedura,
-                domeniu_legislativ=parsed.domeniu_legislativ,
-                tip_procedura=parsed.tip_procedura,
-                parse_warnings=parsed.parse_warnings,
-            )
+            bo_key = (parsed.an_bo, parsed.numar_bo)
+            if filename in existing_filenames or bo_key in existing_bo:
+                logger.debug("decision_already_exists", filename=filename, id=existing_bo.get(bo_key))
+                return ("already_existed", None, None)
+
+            row = {
+                "id": str(uuid4()),
+                "filename": parsed.filename,
+                "numar_bo": parsed.numar_bo,
+                "an_bo": parsed.an_bo,
+                "numar_decizie": parsed.numar_decizie,
+                "complet": parsed.complet,
+                "data_decizie": parsed.data_decizie,
+                "tip_contestatie": parsed.tip_contestatie.value,
+                "coduri_critici": parsed.coduri_critici,
+                "cod_cpv": parsed.cod_cpv,
+                "cpv_source": parsed.cpv_source,
+                "solutie_filename": parsed.solutie_filename.value,
+                "solutie_contestatie": parsed.solutie_contestatie.value if parsed.solutie_contestatie else None,
+                "motiv_respingere": parsed.motiv_respingere,
+                "contestator": parsed.contestator,
+                "autoritate_contractanta": parsed.autoritate_contractanta,
+                "intervenienti": parsed.intervenienti,
+                "text_integral": parsed.text_integral,
+                "obiect_contract": parsed.obiect_contract,
+                "criteriu_atribuire": parsed.criteriu_atribuire,
+                "numar_oferte": parsed.numar_oferte,
+                "valoare_estimata": parsed.valoare_estimata,
+                "moneda": parsed.moneda,
+                "numar_anunt_participare": parsed.numar_anunt_participare,
+                "data_raport_procedura": parsed.data_raport_procedura,
+                "domeniu_legislativ": parsed.domeniu_legislativ,
+                "tip_procedura": parsed.tip_procedura,
+                "parse_warnings": parsed.parse_warnings,
+                "cpv_descriere": None,
+                "cpv_categorie": None,
+                "cpv_clasa": None,
+            }
 
             # Enrich CPV data from nomenclator
-            if cpv_map and decision.cod_cpv and decision.cod_cpv in cpv_map:
-                cpv_info = cpv_map[decision.cod_cpv]
-                decision.cpv_descriere = cpv_info["descriere"]
-                decision.cpv_categorie = cpv_info["categorie"]
-                decision.cpv_clasa = cpv_info["clasa"]
-
-            # Use savepoint so a single failure doesn't poison the batch session
-            async with session.begin_nested():
-                session.add(decision)
-                await session.flush()
-
-            logger.info(
-                "decision_imported",
-                filename=filename,
-                id=decision.id,
-                external_id=decision.external_id,
-            )
+            if cpv_map and row["cod_cpv"] and row["cod_cpv"] in cpv_map:
+                cpv_info = cpv_map[row["cod_cpv"]]
+                row["cpv_descriere"] = cpv_info["descriere"]
+                row["cpv_categorie"] = cpv_info["categorie"]
+                row["cpv_clasa"] = cpv_info["clasa"]
 
-            return ("imported", decision.id, None)
+            existing_filenames.add(filename)
+            existing_bo[bo_key] = row["id"]
+            return ("prepared", row, None)
 
         except Exception as e:
             logger.error(
@@ -253,6 +357,94 @@ class DecisionImporter:
             )
             return ("failed", None, f"{filename}: {str(e)}")
 
+    async def _insert_rows(
+        self,
+        session: AsyncSession,
+        rows: list[dict],
+    ) -> tuple[set[str], dict[str, str]]:
+        """Insert prepared rows, skipping conflicts.
+
+        The whole batch goes in as one INSERT ... ON CONFLICT DO NOTHING.
+        With ``use_copy`` it is first streamed with COPY into a temp table
+        instead, falling back to that INSERT if COPY fails. If the batch
+        INSERT fails too (e.g. one row violates a column limit), rows are
+        retried one by one under savepoints so a single bad file doesn't
+        lose the batch.
+
+        Returns:
+            Tuple of (inserted filenames, filename -> error for failed rows).
+            Rows in neither were skipped as conflicts.
+        """
+        if not rows:
+            return set(), {}
+
+        def stmt(values):
+            return (
+                pg_insert(DecizieCNSC)
+                .values(values)
+                .on_conflict_do_nothing()
+                .returning(DecizieCNSC.filename)
+            )
+
+        if self.use_copy:
+            try:
+                async with session.begin_nested():
+                    return await self._copy_rows(session, rows), {}
+            except Exception as e:
+                logger.warning("copy_insert_failed_retrying_batch", rows=len(rows), error=str(e))
+
+        try:
+            async with session.begin_nested():
+                result = await session.execute(stmt(rows))
+                return set(result.scalars().all()), {}
+        except Exception as e:
+            logger.warning("batch_insert_failed_retrying_per_row", rows=len(rows), error=str(e))
+
+        inserted = set()
+        failed = {}
+        for row in rows:
+            try:
+                async with session.begin_nested():
+                    result = await session.execute(stmt([row]))
+                    inserted.update(result.scalars().all())
+            except Exception as e:
+                logger.error("decision_import_failed", filename=row["filename"], error=str(e))
+                failed[row["filename"]] = str(e)
+        return inserted, failed
+
+    async def _copy_rows(self, session: AsyncSession, rows: list[dict]) -> set[str]:
+        """COPY rows into a temp table, then insert them skipping conflicts.
+
+        Returns:
+            Filenames that were actually inserted.
+        """
+        columns = list(rows[0])
+        records = [
+            tuple(
+                _COPY_ADAPTERS[col](row[col]) if col in _COPY_ADAPTERS and row[col] is not None else row[col]
+                for col in columns
+            )
+            for row in rows
+        ]
+        column_list = ", ".join(columns)
+
+        conn = await session.connection()
+        raw = await conn.get_raw_connection()
+        pg = raw.driver_connection  # asyncpg connection, same transaction
+
+        await pg.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS _import_decizii "
+            "(LIKE decizii_cnsc INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        await pg.copy_records_to_table("_import_decizii", records=records, columns=columns)
+        inserted = await pg.fetch(
+            f"INSERT INTO decizii_cnsc ({column_list}) "
+            f"SELECT {column_list} FROM _import_decizii "
+            "ON CONFLICT DO NOTHING RETURNING filename"
+        )
+        await pg.execute("TRUNCATE _import_decizii")
+        return {record["filename"] for record in inserted}
+
     async def _load_existing_filenames(self) -> set[str]:
         """Pre-load all existing filenames from DB for fast skip checks."""
         async with db_session.async_session_factory() as session:
@@ -261,6 +453,14 @@ class DecisionImporter:
             )
             return {row[0] for row in result.all()}
 
+    async def _load_existing_bo_numbers(self) -> dict[tuple[int, int], str]:
+        """Pre-load (an_bo, numar_bo) -> id for in-memory duplicate checks."""
+        async with db_session.async_session_factory() as session:
+            result = await session.execute(
+                select(DecizieCNSC.an_bo, DecizieCNSC.numar_bo, DecizieCNSC.id)
+            )
+            return {(row.an_bo, row.numar_bo): row.id for row in result.all()}
+
     async def _load_cpv_nomenclator(self) -> dict:
         """Load CPV nomenclator into memory for enrichment during import.
 
@@ -312,91 +512,144 @@ class DecisionImporter:
 
         # Pre-load existing filenames to skip without downloading
         existing_filenames = await self._load_existing_filenames()
+        existing_bo = await self._load_existing_bo_numbers()
         logger.info("existing_filenames_loaded", count=len(existing_filenames))
 
         # Pre-load CPV nomenclator for enrichment
         cpv_map = await self._load_cpv_nomenclator()
         logger.info("cpv_nomenclator_loaded", count=len(cpv_map))
 
-        # List GCS files, filtering out already-imported ones during iteration
+        # Stream GCS listing, filtering out already-imported ones during
+        # iteration; batches start as soon as the first page is listed
         logger.info("gcs_listing_starting", limit=limit, since=since)
-        new_files, already_existed = self.list_new_files(existing_filenames, limit=limit, since=since)
-        stats["already_existed"] = already_existed
-        stats["total_files"] = len(new_files) + already_existed
-
-        logger.info(
-            "import_starting",
-            total_files=stats["total_files"],
-            already_existed=already_existed,
-            new_files=len(new_files),
+        listing_counts: dict[str, int] = {}
+        listing = self.iter_new_files(existing_filenames, listing_counts, limit=limit, since=since)
+
+        # Process only new files in batches. Downloads run on a shared thread
+        # pool and the next batch is listed and prefetched while the current
+        # one is parsed and committed, so GCS latency overlaps with DB work.
+        # Parsing runs on a process pool (one worker per CPU).
+        #
+        # With --parse-cache, files that previously could not be imported
+        # (skipped for invalid metadata or failed to parse) are remembered by
+        # GCS md5 + parser version, so re-runs neither download nor re-parse
+        # them while both are unchanged.
+        parse_cache = shelve.open(self.parse_cache_path) if self.parse_cache_path else {}
+        executor = ThreadPoolExecutor(max_workers=DOWNLOAD_CONCURRENCY)
+        # Spawn, not fork: the download threads and the asyncpg pool are
+        # already running, and forking a threaded process can deadlock
+        parse_pool = ProcessPoolExecutor(
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_configure_log_level,
+            initargs=(self.log_level,),
         )
 
-        # Process only new files in batches with parallel downloads
-        loop = asyncio.get_event_loop()
-        for i in range(0, len(new_files), batch_size):
-            batch = new_files[i:i + batch_size]
-
-            # Download all files in this batch concurrently (10 threads)
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                download_futures = {
-                    blob_name: loop.run_in_executor(executor, self.download_file, blob_name)
-                    for blob_name in batch
-                }
-                downloaded = {}
-                for blob_name, future in download_futures.items():
-                    try:
-                        downloaded[blob_name] = await future
-                    except Exception as e:
-                        stats["failed"] += 1
-                        stats["errors"].append(f"{blob_name}: download failed: {e}")
-                        logger.error("download_failed", file=blob_name, error=str(e))
-
-            logger.info(
-                "batch_downloaded",
-                batch_num=i // batch_size + 1,
-                downloaded=len(downloaded),
-                failed=len(batch) - len(downloaded),
-            )
+        loop = asyncio.get_running_loop()
 
-            async with db_session.async_session_factory() as session:
-                for blob_name, content in downloaded.items():
-                    try:
-                        # Import to database
-                        status, decision_id, error_msg = await self.import_decision(
-                            session, blob_name, content, cpv_map=cpv_map
-                        )
+        async def fetch_batch() -> tuple[list[str], dict[str, str], list[tuple[str, Exception]]]:
+            # Listing pages are fetched synchronously, so pull off the event loop
+            batch = await loop.run_in_executor(None, lambda: list(islice(listing, batch_size)))
+            to_fetch = [b for b in batch if self._cached_result(parse_cache, b) is None]
+            downloaded, failures = await self._download_batch(executor, to_fetch)
+            return batch, downloaded, failures
 
-                        if status == "imported":
-                            stats["imported"] += 1
-                        elif status == "already_existed":
-                            stats["already_existed"] += 1
-                        elif status == "skipped":
-                            stats["skipped"] += 1
-                            stats["skipped_files"].append(error_msg)
-                        else:  # failed
-                            stats["failed"] += 1
-                            if error_msg:
-                                stats["errors"].append(error_msg)
+        next_fetch = asyncio.ensure_future(fetch_batch())
+        batch_num = 0
+        processed = 0
+        try:
+            while True:
+                batch, downloaded, failures = await next_fetch
+                if not batch:
+                    break
+                batch_num += 1
+                processed += len(batch)
+                next_fetch = asyncio.ensure_future(fetch_batch())
+
+                for blob_name in batch:
+                    cached = self._cached_result(parse_cache, blob_name)
+                    if cached is not None:
+                        status, error_msg = cached
+                        stats[status] += 1
+                        stats["skipped_files" if status == "skipped" else "errors"].append(error_msg)
+
+                for blob_name, e in failures:
+                    stats["failed"] += 1
+                    stats["errors"].append(f"{blob_name}: download failed: {e}")
+                    logger.error("download_failed", file=blob_name, error=str(e))
+
+                logger.info(
+                    "batch_downloaded",
+                    batch_num=batch_num,
+                    downloaded=len(downloaded),
+                    failed=len(failures),
+                )
 
-                    except Exception as e:
+                # Parse the batch in worker processes, then insert it with a
+                # single statement
+                rows = []
+                for blob_name, parsed in await self._parse_batch(parse_pool, downloaded):
+                    cache_key = self._parse_cache_key(blob_name)
+                    if isinstance(parsed, Exception):
+                        filename = _basename(blob_name)
+                        error_msg = f"{filename}: {parsed}"
                         stats["failed"] += 1
-                        error_msg = f"{blob_name}: {str(e)}"
                         stats["errors"].append(error_msg)
-                        logger.error("file_processing_failed", file=blob_name, error=str(e))
-
-                # Commit batch
-                try:
-                    await session.commit()
-                    logger.info(
-                        "batch_committed",
-                        batch_num=i // batch_size + 1,
-                        processed=min(i + batch_size, len(new_files)),
-                        total=len(new_files),
+                        logger.error("decision_import_failed", filename=filename, error=str(parsed))
+                        if cache_key:
+                            parse_cache[cache_key] = ("failed", error_msg)
+                        continue
+
+                    status, row, error_msg = self.prepare_decision(
+                        blob_name, parsed, existing_filenames, existing_bo, cpv_map=cpv_map
                     )
-                except Exception as e:
-                    await session.rollback()
-                    logger.error("batch_commit_failed", error=str(e))
-                    stats["failed"] += len(batch)
+                    if status == "skipped" and cache_key:
+                        parse_cache[cache_key] = ("skipped", error_msg)
+
+                    if status == "prepared":
+                        rows.append(row)
+                    elif status == "already_existed":
+                        stats["already_existed"] += 1
+                    elif status == "skipped":
+                        stats["skipped"] += 1
+                        stats["skipped_files"].append(error_msg)
+                    else:  # failed
+                        stats["failed"] += 1
+                        if error_msg:
+                            stats["errors"].append(error_msg)
+
+                async with db_session.async_session_factory() as session:
+                    inserted, insert_errors = await self._insert_rows(session, rows)
+
+                    # Commit batch
+                    try:
+                        await session.commit()
+                        stats["imported"] += len(inserted)
+                        stats["already_existed"] += len(rows) - len(inserted) - len(insert_errors)
+                        stats["failed"] += len(insert_errors)
+                        stats["errors"].extend(f"{name}: {err}" for name, err in insert_errors.items())
+                        logger.info(
+                            "batch_committed",
+                            batch_num=batch_num,
+                            imported=len(inserted),
+                            processed=processed,
+                        )
+                    except Exception as e:
+                        await session.rollback()
+                        logger.error("batch_commit_failed", error=str(e))
+                        # Only the rows of this insert were lost; cached, skipped
+                        # and failed files are already counted above
+                        stats["failed"] += len(rows)
+        finally:
+            # Drop the prefetch of a batch that will never be processed
+            next_fetch.cancel()
+            await asyncio.gather(next_fetch, return_exceptions=True)
+            executor.shutdown(wait=False, cancel_futures=True)
+            parse_pool.shutdown(cancel_futures=True)
+            if isinstance(parse_cache, shelve.Shelf):
+                parse_cache.close()
+
+        stats["already_existed"] += listing_counts["already_existed"]
+        stats["total_files"] = listing_counts["new"] + listing_counts["already_existed"]
 
         # Generate embeddings if not skipped
         if not self.skip_embeddings:
@@ -484,6 +737,25 @@ async def main():
         action="store_true",
         help="Skip embedding generation",
     )
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Minimum log level (default: INFO). Per-file events are DEBUG; "
+             "progress is logged once per batch",
+    )
+    parser.add_argument(
+        "--parse-cache",
+        metavar="PATH",
+        help="Shelve file remembering files that could not be imported, so "
+             "re-runs skip downloading and parsing them until they change",
+    )
+    parser.add_argument(
+        "--copy",
+        action="store_true",
+        help="Load each batch with COPY through a temp table (experimental; "
+             "falls back to the batch INSERT on error)",
+    )
     parser.add_argument(
         "--create-tables",
         action="store_true",
@@ -512,6 +784,8 @@ async def main():
 
     args = parser.parse_args()
 
+    _configure_log_level(args.log_level)
+
     # Initialize database
     logger.info("initializing_database")
     db_initialized = await init_db()
@@ -595,6 +869,9 @@ async def main():
         folder_name=args.folder,
         project_id=args.project,
         skip_embeddings=args.skip_embeddings,
+        parse_cache_path=args.parse_cache,
+        use_copy=args.copy,
+        log_level=args.log_level,
     )
 
     # Connect to GCS